@@ -1,108 +1,152 @@
-# 0_search_legal_keyword.py
-"""
-법령정보지식베이스 - 법령용어 조회 API (lstrmAI)
-"""
-
-import requests
-import xml.etree.ElementTree as ET
-from typing import List, Dict
-
-OC = "turtle816"
-
-
-# -------------------------------------------------
-# XML → dict 변환 함수
-# -------------------------------------------------
-def parse_lstrmAI_item(node):
-    term_id = node.attrib.get("id", "")
-
-    # 태그 특성상 공백·제어문자 들어가는 경우가 있어 정규화 처리
-    def safe_text(tagname):
-        # 1차: 정확히 찾기
-        child = node.find(tagname)
-        if child is not None and child.text:
-            return child.text.strip()
-
-        # 2차: 공백 제거 후 매칭
-        target_norm = tagname.replace(" ", "")
-        for c in node:
-            if target_norm in c.tag.replace(" ", ""):
-                return (c.text or "").strip()
-
-        return ""
-
-    return {
-        "법령용어id": term_id,
-        "법령용어명": safe_text("법령용어명"),
-        "동음이의어존재여부": safe_text("동음이의어존재여부"),
-        "비고": safe_text("비고"),
-        "용어간관계링크": safe_text("용어간관계링크"),
-        "조문간관계링크": safe_text("조문간관계링크"),
-    }
-
-
-# -------------------------------------------------
-# API 요청 함수
-# -------------------------------------------------
-def fetch_legal_terms(keyword: str, page: int = 1, num_rows: int = 100) -> Dict:
-
-    url = (
-        "https://www.law.go.kr/DRF/lawSearch.do"
-        f"?OC={OC}&target=lstrmAI&type=XML"
-        f"&query={keyword}"
-        f"&display={num_rows}"
-        f"&page={page}"
-    )
-
-    res = requests.get(url)
-    res.raise_for_status()
-
-    root = ET.fromstring(res.text)
-
-    # 전체 건수
-    total_count = int(root.findtext("검색결과개수", 0))
-
-    # ---------------------------
-    # 핵심 수정 포인트: 법령용어 태그 수집
-    # ---------------------------
-    items = []
-    for child in root:
-        # 태그 이름에 공백, BOM, 제어문자 등이 있어도 매칭되도록
-        if "법령용어" in child.tag:
-            items.append(parse_lstrmAI_item(child))
-
-    return {
-        "total_count": total_count,
-        "items": items
-    }
-
-
-# -------------------------------------------------
-# 전체 페이지 수집 함수
-# -------------------------------------------------
-def fetch_all_legal_terms(keyword: str, max_rows: int = 100) -> List[Dict]:
-    first = fetch_legal_terms(keyword, page=1, num_rows=max_rows)
-    total_count = first["total_count"]
-    results = first["items"]
-
-    print(f"[INFO] 검색어 '{keyword}' → 총 {total_count}건")
-    total_pages = (total_count // max_rows) + 1
-
-    for page in range(2, total_pages + 1):
-        print(f"[INFO] Collecting page {page}/{total_pages} ...")
-        data = fetch_legal_terms(keyword, page=page, num_rows=max_rows)
-        results.extend(data["items"])
-
-    print(f"[INFO] 최종 수집 용어 개수: {len(results)}")
-    return results
-
-
-# -------------------------------------------------
-# 실행 예시
-# -------------------------------------------------
-if __name__ == "__main__":
-    keyword = "배상"
-    items = fetch_all_legal_terms(keyword, max_rows=100)
-
-    for item in items[:10]:
-        print(item)
+# 0_search_legal_keyword.py
+"""
+법령정보지식베이스 - 법령용어 조회 API (lstrmAI)
+"""
+
+import math
+
+import requests
+try:
+    from lxml import etree as ET  # type: ignore  # 설치 시 libxml2 C 파서 사용
+except ImportError:
+    import xml.etree.ElementTree as ET  # type: ignore
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict
+
+OC = "turtle816"
+
+# 페이지 병렬 수집용 워커 수 / 공유 세션 (keep-alive 풀링 + 재시도)
+MAX_WORKERS = 8
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    ),
+)
+
+
+# -------------------------------------------------
+# XML → dict 변환 함수
+# -------------------------------------------------
+def parse_lstrmAI_item(node):
+    term_id = node.attrib.get("id", "")
+
+    # 태그 특성상 공백·제어문자 들어가는 경우가 있어 정규화 처리
+    def safe_text(tagname):
+        # 1차: 정확히 찾기
+        child = node.find(tagname)
+        if child is not None and child.text:
+            return child.text.strip()
+
+        # 2차: 공백 제거 후 매칭
+        target_norm = tagname.replace(" ", "")
+        for c in node:
+            # lxml 주석/PI 노드는 tag가 str이 아니다 (law_api._norm과 동일 가드)
+            if isinstance(c.tag, str) and target_norm in c.tag.replace(" ", ""):
+                return (c.text or "").strip()
+
+        return ""
+
+    return {
+        "법령용어id": term_id,
+        "법령용어명": safe_text("법령용어명"),
+        "동음이의어존재여부": safe_text("동음이의어존재여부"),
+        "비고": safe_text("비고"),
+        "용어간관계링크": safe_text("용어간관계링크"),
+        "조문간관계링크": safe_text("조문간관계링크"),
+    }
+
+
+# -------------------------------------------------
+# API 요청 함수
+# -------------------------------------------------
+def fetch_legal_terms(keyword: str, page: int = 1, num_rows: int = 100) -> Dict:
+
+    # params=로 넘기면 requests가 keyword의 &/= 등을 안전하게 인코딩한다
+    res = _SESSION.get(
+        "https://www.law.go.kr/DRF/lawSearch.do",
+        params={
+            "OC": OC,
+            "target": "lstrmAI",
+            "type": "XML",
+            "query": keyword,
+            "display": num_rows,
+            "page": page,
+        },
+    )
+    res.raise_for_status()
+
+    root = ET.fromstring(res.content)
+
+    # 전체 건수
+    total_count = int(root.findtext("검색결과개수", 0))
+
+    # ---------------------------
+    # 핵심 수정 포인트: 법령용어 태그 수집
+    # ---------------------------
+    items = []
+    for child in root:
+        # 태그 이름에 공백, BOM, 제어문자 등이 있어도 매칭되도록
+        # (lxml 주석 노드는 tag가 str이 아니므로 걸러낸다)
+        if isinstance(child.tag, str) and "법령용어" in child.tag:
+            items.append(parse_lstrmAI_item(child))
+
+    return {
+        "total_count": total_count,
+        "items": items
+    }
+
+
+# -------------------------------------------------
+# 전체 페이지 수집 함수
+# -------------------------------------------------
+def fetch_all_legal_terms(keyword: str, max_rows: int = 100) -> List[Dict]:
+    first = fetch_legal_terms(keyword, page=1, num_rows=max_rows)
+    total_count = first["total_count"]
+    results = first["items"]
+
+    print(f"[INFO] 검색어 '{keyword}' → 총 {total_count}건")
+    # 올림 나눗셈: 기존 //+1 방식은 나누어떨어질 때 빈 페이지를 한 번 더 요청했다
+    total_pages = math.ceil(total_count / max_rows) if total_count else 1
+
+    # 2페이지 이후는 서로 독립적인 GET이므로 병렬로 수집 (I/O bound)
+    if total_pages >= 2:
+        pages = range(2, total_pages + 1)
+        page_items: Dict[int, List[Dict]] = {}
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(fetch_legal_terms, keyword, page, max_rows): page
+                for page in pages
+            }
+            for future in as_completed(futures):
+                page = futures[future]
+                print(f"[INFO] Collected page {page}/{total_pages}")
+                page_items[page] = future.result()["items"]
+
+        # 페이지 순서 유지를 위해 번호순으로 이어붙임 + 조기 종료
+        for page in pages:
+            items = page_items.get(page, [])
+            if not items:
+                break  # 빈 페이지 이후는 더 볼 것이 없다
+            results.extend(items)
+            if len(results) >= total_count:
+                break
+
+    print(f"[INFO] 최종 수집 용어 개수: {len(results)}")
+    return results
+
+
+# -------------------------------------------------
+# 실행 예시
+# -------------------------------------------------
+if __name__ == "__main__":
+    keyword = "배상"
+    items = fetch_all_legal_terms(keyword, max_rows=100)
+
+    for item in items[:10]:
+        print(item)
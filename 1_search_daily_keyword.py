@@ -1,105 +1,149 @@
-# 1_search_daily_terms.py
-"""
-일상용어 조회 API (dlytrm)
-- 특정 query로 검색
-- 페이지네이션 처리
-- XML → Python dict 변환
-"""
-
-import requests
-import xml.etree.ElementTree as ET
-from typing import List, Dict
-
-OC = "turtle816"   # OC 값
-
-
-# -------------------------------------------------
-# XML → dict 변환 함수
-# -------------------------------------------------
-def parse_dlytrm_item(node):
-    """일상용어(dlytrm) XML 항목 파싱"""
-
-    # 1) attribute에서 id 찾기 (드물지만 있을 수 있음)
-    item_id = node.attrib.get("id", "")
-
-    # 2) <id> 태그에서 찾기
-    id_tag = node.find("id")
-    if id_tag is not None and id_tag.text:
-        item_id = id_tag.text.strip()
-
-    def safe_text(tagname):
-        child = node.find(tagname)
-        if child is not None and child.text:
-            return child.text.strip()
-        for c in node:
-            if tagname.replace(" ", "") in c.tag.replace(" ", ""):
-                return (c.text or "").strip()
-        return ""
-
-    return {
-        "일상용어id": item_id,
-        "일상용어명": safe_text("일상용어명"),
-        "출처": safe_text("출처"),
-        "용어간관계링크": safe_text("용어간관계링크"),
-    }
-
-
-# -------------------------------------------------
-# API 요청 함수
-# -------------------------------------------------
-def fetch_daily_terms(keyword="*", page=1, num_rows=100):
-    """일상용어 검색 (dlytrm)"""
-
-    url = (
-        "https://www.law.go.kr/DRF/lawSearch.do"
-        f"?OC={OC}&target=dlytrm&type=XML"
-        f"&query={keyword}"
-        f"&display={num_rows}"
-        f"&page={page}"
-    )
-
-    res = requests.get(url)
-    res.raise_for_status()
-
-    root = ET.fromstring(res.text)
-
-    total_count = int(root.findtext("검색결과개수", 0))
-
-    items = []
-    for child in root:
-        if "일상용어" in child.tag:
-            items.append(parse_dlytrm_item(child))
-
-    return {
-        "total_count": total_count,
-        "items": items
-    }
-
-
-# -------------------------------------------------
-# 전체 페이지 수집 함수
-# -------------------------------------------------
-def fetch_all_daily_terms(keyword="*", max_rows=100) -> List[Dict]:
-    first = fetch_daily_terms(keyword, page=1, num_rows=max_rows)
-    total_count = first["total_count"]
-    results = first["items"]
-
-    print(f"[INFO] 검색어 '{keyword}' → 총 {total_count}건")
-
-    total_pages = (total_count // max_rows) + 1
-
-    for page in range(2, total_pages + 1):
-        print(f"[INFO] Collecting page {page}/{total_pages} ...")
-        data = fetch_daily_terms(keyword, page=page, num_rows=max_rows)
-        results.extend(data["items"])
-
-    print(f"[INFO] 최종 수집 일상용어 개수: {len(results)}")
-    return results
-
-
-# -------------------------------------------------
-# 실행 테스트
-# -------------------------------------------------
-if __name__ == "__main__":
-    items = fetch_daily_terms("보험")  # 테스트
-    print(items["items"][:5])
+# 1_search_daily_terms.py
+"""
+일상용어 조회 API (dlytrm)
+- 특정 query로 검색
+- 페이지네이션 처리
+- XML → Python dict 변환
+"""
+
+import math
+
+import requests
+try:
+    from lxml import etree as ET  # type: ignore  # 설치 시 libxml2 C 파서 사용
+except ImportError:
+    import xml.etree.ElementTree as ET  # type: ignore
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict
+
+OC = "turtle816"   # OC 값
+
+# 페이지 병렬 수집용 워커 수 / 공유 세션 (keep-alive 풀링 + 재시도)
+MAX_WORKERS = 8
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    ),
+)
+
+
+# -------------------------------------------------
+# XML → dict 변환 함수
+# -------------------------------------------------
+def parse_dlytrm_item(node):
+    """일상용어(dlytrm) XML 항목 파싱"""
+
+    # 1) attribute에서 id 찾기 (드물지만 있을 수 있음)
+    item_id = node.attrib.get("id", "")
+
+    # 2) <id> 태그에서 찾기
+    id_tag = node.find("id")
+    if id_tag is not None and id_tag.text:
+        item_id = id_tag.text.strip()
+
+    def safe_text(tagname):
+        child = node.find(tagname)
+        if child is not None and child.text:
+            return child.text.strip()
+        for c in node:
+            # lxml 주석/PI 노드는 tag가 str이 아니다 (law_api._norm과 동일 가드)
+            if isinstance(c.tag, str) and tagname.replace(" ", "") in c.tag.replace(" ", ""):
+                return (c.text or "").strip()
+        return ""
+
+    return {
+        "일상용어id": item_id,
+        "일상용어명": safe_text("일상용어명"),
+        "출처": safe_text("출처"),
+        "용어간관계링크": safe_text("용어간관계링크"),
+    }
+
+
+# -------------------------------------------------
+# API 요청 함수
+# -------------------------------------------------
+def fetch_daily_terms(keyword="*", page=1, num_rows=100):
+    """일상용어 검색 (dlytrm)"""
+
+    # params=로 넘기면 requests가 keyword의 &/= 등을 안전하게 인코딩한다
+    res = _SESSION.get(
+        "https://www.law.go.kr/DRF/lawSearch.do",
+        params={
+            "OC": OC,
+            "target": "dlytrm",
+            "type": "XML",
+            "query": keyword,
+            "display": num_rows,
+            "page": page,
+        },
+    )
+    res.raise_for_status()
+
+    root = ET.fromstring(res.content)
+
+    total_count = int(root.findtext("검색결과개수", 0))
+
+    items = []
+    for child in root:
+        # lxml 주석 노드는 tag가 str이 아니므로 걸러낸다
+        if isinstance(child.tag, str) and "일상용어" in child.tag:
+            items.append(parse_dlytrm_item(child))
+
+    return {
+        "total_count": total_count,
+        "items": items
+    }
+
+
+# -------------------------------------------------
+# 전체 페이지 수집 함수
+# -------------------------------------------------
+def fetch_all_daily_terms(keyword="*", max_rows=100) -> List[Dict]:
+    first = fetch_daily_terms(keyword, page=1, num_rows=max_rows)
+    total_count = first["total_count"]
+    results = first["items"]
+
+    print(f"[INFO] 검색어 '{keyword}' → 총 {total_count}건")
+
+    # 올림 나눗셈: 기존 //+1 방식은 나누어떨어질 때 빈 페이지를 한 번 더 요청했다
+    total_pages = math.ceil(total_count / max_rows) if total_count else 1
+
+    # 2페이지 이후는 서로 독립적인 GET이므로 병렬로 수집 (I/O bound)
+    if total_pages >= 2:
+        pages = range(2, total_pages + 1)
+        page_items: Dict[int, List[Dict]] = {}
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(fetch_daily_terms, keyword, page, max_rows): page
+                for page in pages
+            }
+            for future in as_completed(futures):
+                page = futures[future]
+                print(f"[INFO] Collected page {page}/{total_pages}")
+                page_items[page] = future.result()["items"]
+
+        # 페이지 순서 유지를 위해 번호순으로 이어붙임 + 조기 종료
+        for page in pages:
+            items = page_items.get(page, [])
+            if not items:
+                break  # 빈 페이지 이후는 더 볼 것이 없다
+            results.extend(items)
+            if len(results) >= total_count:
+                break
+
+    print(f"[INFO] 최종 수집 일상용어 개수: {len(results)}")
+    return results
+
+
+# -------------------------------------------------
+# 실행 테스트
+# -------------------------------------------------
+if __name__ == "__main__":
+    items = fetch_daily_terms("보험")  # 테스트
+    print(items["items"][:5])
@@ -1,15 +1,23 @@
 ﻿from __future__ import annotations
 
 import re
+import threading
 from collections import Counter
-from typing import Iterable, List, Sequence, Set
+from functools import lru_cache
+from typing import Iterable, List, Sequence, Set, Tuple
 
 try:
     from konlpy.tag import Okt  # type: ignore
 except Exception:
     Okt = None  # type: ignore
 
+try:
+    import ahocorasick  # type: ignore
+except Exception:
+    ahocorasick = None  # type: ignore
+
 _okt = None
+_okt_lock = threading.Lock()  # Okt(JVM) 초기화는 스레드 안전하지 않다
 
 # 기본 불용어(조사, 연결어, 일반 동사)
 DEFAULT_STOPWORDS: Set[str] = {
@@ -73,6 +81,9 @@ DEFAULT_STOPWORDS: Set[str] = {
     "되나요",
 }
 
+# 호출마다 set 복사를 피하기 위한 불변 스냅샷
+_DEFAULT_STOPWORDS_FS: frozenset[str] = frozenset(DEFAULT_STOPWORDS)
+
 # 단어 내 불필요 어미/조사 제거용 패턴
 TRAILING_PARTICLES = re.compile(
     r"(입니다|합니다|했다|했음|했어요|했는데|했지만|하고|하며|하고|이다|였다|하나요|하냐|하니|하네|되나요|됩니까)$"
@@ -101,6 +112,22 @@ DOMAIN_EXPAND_RULES: list[tuple[re.Pattern, Sequence[str]]] = [
     (re.compile(r"(사기|기망|속임)"), ("사기", "기망", "형사", "손해배상")),
 ]
 
+# 규칙별 패턴을 그룹 이름(d<규칙 인덱스>)을 가진 하나의 정규식으로 융합.
+# 토큰을 한 번만 스캔하고 매칭된 규칙 인덱스만 수집한다.
+_DOMAIN_RULES_RE = re.compile(
+    "|".join(f"(?P<d{i}>{pattern.pattern})" for i, (pattern, _) in enumerate(DOMAIN_EXPAND_RULES))
+)
+
+# pyahocorasick이 있으면 규칙 리터럴을 자동자(automaton)로 굽는다.
+# 규칙 패턴이 리터럴 교대식 "(a|b|c)"이라 리터럴 단위로 분해 가능.
+_DOMAIN_AUTOMATON = None
+if ahocorasick is not None:
+    _DOMAIN_AUTOMATON = ahocorasick.Automaton()
+    for _i, (_pattern, _) in enumerate(DOMAIN_EXPAND_RULES):
+        for _literal in _pattern.pattern.strip("()").split("|"):
+            _DOMAIN_AUTOMATON.add_word(_literal, _i)
+    _DOMAIN_AUTOMATON.make_automaton()
+
 
 SEARCH_SYNONYMS: dict[str, Sequence[str]] = {
     "잠수": ("연락두절", "연락불능", "행방불명", "도피"),
@@ -123,15 +150,27 @@ SEARCH_SYNONYMS: dict[str, Sequence[str]] = {
 def _get_okt():
     global _okt
     if _okt is None and Okt:
-        _okt = Okt()
+        with _okt_lock:
+            if _okt is None:
+                _okt = Okt()
     return _okt
 
 
+def warm_up() -> None:
+    """Okt(JVM) 기동 + 첫 형태소 분석을 미리 수행해 콜드스타트를 없앤다."""
+    okt = _get_okt()
+    if okt:
+        okt.pos("워밍업", norm=True, stem=True)
+
+
 def _simple_tokens(text: str) -> list[str]:
     return re.findall(r"[가-힣]{2,}|[A-Za-z0-9]{2,}", text)
 
 
-def _tokenize(text: str) -> list[str]:
+# 형태소 분석(Okt)은 모듈에서 가장 무거운 단계라 입력 텍스트 단위로 캐시한다.
+# 캐시된 결과가 변형되지 않도록 튜플로 돌려준다.
+@lru_cache(maxsize=4096)
+def _tokenize(text: str) -> tuple[str, ...]:
     okt = _get_okt()
     if okt:
         tokens: list[str] = []
@@ -141,10 +180,21 @@ def _tokenize(text: str) -> list[str]:
             if len(word) < 2:
                 continue
             tokens.append(word)
-        return tokens
-    return _simple_tokens(text)
+        return tuple(tokens)
+    return tuple(_simple_tokens(text))
+
 
+def tokenize_batch(texts: Sequence[str]) -> List[Tuple[str, ...]]:
+    """여러 텍스트를 한 배치로 토큰화.
 
+    Okt(JVM) 기동을 배치당 1회로 고정하고 _tokenize의 lru_cache를 공유하므로
+    배치 내 중복/재등장 텍스트는 형태소 분석 없이 재사용된다.
+    """
+    _get_okt()
+    return [_tokenize(text) for text in texts]
+
+
+@lru_cache(maxsize=8192)
 def _normalize_token(token: str) -> str:
     token = token.strip()
     token = TRAILING_PARTICLES.sub("", token)
@@ -207,19 +257,25 @@ ENDINGS_TO_STRIP: tuple[str, ...] = (
     "겠습",
 )
 
+# 어미 목록을 하나의 교대(alternation) 정규식으로 묶는다. 긴 어미가 먼저
+# 매칭되도록 길이 내림차순으로 정렬.
+ENDINGS_RE = re.compile(
+    "(" + "|".join(sorted(map(re.escape, set(ENDINGS_TO_STRIP)), key=len, reverse=True)) + ")$"
+)
+
 
-def _derive_meaning_units(token: str) -> List[str]:
+@lru_cache(maxsize=8192)
+def _derive_meaning_units(token: str) -> Tuple[str, ...]:
     """추출된 토큰을 의미 단위로 잘게 쪼개고 기본형을 추가."""
     units: list[str] = []
 
-    # 격식/어미 제거
-    for ending in ENDINGS_TO_STRIP:
-        if token.endswith(ending) and len(token) - len(ending) >= 2:
-            stripped = token[: -len(ending)]
-            if stripped not in units:
-                units.append(stripped)
-            token = stripped
-            break
+    # 격식/어미 제거 (어미 목록 전체를 한 번의 정규식 매칭으로 처리)
+    m = ENDINGS_RE.search(token)
+    if m and len(token) - len(m.group(1)) >= 2:
+        stripped = token[: m.start()]
+        if stripped not in units:
+            units.append(stripped)
+        token = stripped
 
     # 동사/형용사 기본형 복원 규칙 적용
     for pattern, base in VERB_BASE_RULES:
@@ -231,78 +287,92 @@ def _derive_meaning_units(token: str) -> List[str]:
     if token.endswith("하") and "하다" not in units:
         units.append("하다")
 
-    return [u for u in units if len(u) >= 2]
+    return tuple(u for u in units if len(u) >= 2)
 
 
 def _expand_domain(token: str) -> list[str]:
+    hit_rules: set[int] = set()
+    if _DOMAIN_AUTOMATON is not None:
+        # 토큰을 한 번만 스캔하면서 겹치는 매칭까지 모두 수집
+        hit_rules = {rule for _, rule in _DOMAIN_AUTOMATON.iter(token)}
+    else:
+        for m in _DOMAIN_RULES_RE.finditer(token):
+            if m.lastgroup:
+                hit_rules.add(int(m.lastgroup[1:]))
     extras: list[str] = []
-    for pattern, additions in DOMAIN_EXPAND_RULES:
-        if pattern.search(token):
-            extras.extend(additions)
+    for i in sorted(hit_rules):  # 기존 규칙 순서대로 확장어 유지
+        extras.extend(DOMAIN_EXPAND_RULES[i][1])
     return extras
 
 
-def expand_related_terms(token: str) -> List[str]:
-    """원문 토큰으로부터 검색 확장어를 생성."""
+@lru_cache(maxsize=4096)
+def _expand_related_cached(token: str) -> Tuple[str, ...]:
     related: List[str] = []
     if token in SEARCH_SYNONYMS:
         related.extend(SEARCH_SYNONYMS[token])
     # 도메인 규칙 기반 확장도 추가
     related.extend(_expand_domain(token))
-    # 중복 제거 유지
-    deduped: List[str] = []
-    for r in related:
-        if r not in deduped and r != token:
-            deduped.append(r)
-    return deduped
+    # 삽입 순서를 유지하는 dict 기반 중복 제거
+    return tuple(r for r in dict.fromkeys(related) if r != token)
 
 
-def extract_keywords(
-    text: str,
-    top_k: int = 8,
-    extra_stopwords: Iterable[str] | None = None,
-    expand_synonyms: bool = True,
-) -> List[str]:
-    """Extract legal-oriented keywords from Korean text."""
+def expand_related_terms(token: str) -> List[str]:
+    """원문 토큰으로부터 검색 확장어를 생성."""
+    return list(_expand_related_cached(token))
 
-    if not text:
-        return []
 
-    stopwords: Set[str] = set(DEFAULT_STOPWORDS)
-    if extra_stopwords:
-        stopwords.update(extra_stopwords)
+@lru_cache(maxsize=2048)
+def _extract_cached(
+    text: str,
+    top_k: int,
+    stop_key: frozenset[str],
+    expand_synonyms: bool,
+) -> Tuple[str, ...]:
+    # 추가 불용어가 없는 공통 경로에서는 기본 frozenset을 복사 없이 재사용
+    stopwords = _DEFAULT_STOPWORDS_FS | stop_key if stop_key else _DEFAULT_STOPWORDS_FS
 
     raw_tokens = _tokenize(text)
-    tokens = []
+    tokens: List[str] = []
     for tok in raw_tokens:
         norm = _normalize_token(tok)
         if len(norm) < 2:
             continue
         if norm in stopwords:
             continue
-        # 원래 토큰 + 의미 단위 후보 모두 보관
-        for piece in [norm, *_derive_meaning_units(norm)]:
-            if piece not in tokens:
-                tokens.append(piece)
-
-    counts = Counter(tokens)
+        # 원래 토큰 + 의미 단위 후보를 중복 포함해 누적 → 빈도가 의미를 가진다
+        tokens.extend((norm, *_derive_meaning_units(norm)))
 
-    keywords: List[str] = []
-    for word, _ in counts.most_common():
-        if word in keywords:
-            continue
-        keywords.append(word)
-        if len(keywords) >= top_k:
-            break
+    # 자주 등장한 토큰이 top_k 안에 먼저 들어간다 (동률은 등장 순서 유지).
+    # Counter 키는 유일하므로 별도 dedup 패스가 필요 없다.
+    keywords: List[str] = [word for word, _ in Counter(tokens).most_common(top_k)]
+    keywords_seen: Set[str] = set(keywords)
 
     if expand_synonyms:
         base_list = list(keywords)
         for key in base_list:
             for synonym in SYNONYM_SEEDS.get(key, ()):  # type: ignore[arg-type]
-                if synonym not in stopwords and synonym not in keywords:
+                if synonym not in stopwords and synonym not in keywords_seen:
+                    keywords_seen.add(synonym)
                     keywords.append(synonym)
             for extra in _expand_domain(key):
-                if extra not in stopwords and extra not in keywords:
+                if extra not in stopwords and extra not in keywords_seen:
+                    keywords_seen.add(extra)
                     keywords.append(extra)
 
-    return keywords
+    return tuple(keywords)
+
+
+def extract_keywords(
+    text: str,
+    top_k: int = 8,
+    extra_stopwords: Iterable[str] | None = None,
+    expand_synonyms: bool = True,
+) -> List[str]:
+    """Extract legal-oriented keywords from Korean text."""
+
+    if not text:
+        return []
+
+    # 동일 입력 반복 시 형태소 분석을 건너뛰도록 결과 자체를 캐시
+    stop_key = frozenset(extra_stopwords or ())
+    return list(_extract_cached(text, top_k, stop_key, expand_synonyms))
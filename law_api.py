@@ -2,9 +2,60 @@
 
 import os
 import xml.etree.ElementTree as ET
+from datetime import timedelta
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from requests_cache import CachedSession  # type: ignore
+except Exception:
+    CachedSession = None  # type: ignore
+
+try:
+    from lxml import etree as _lxml_etree  # type: ignore
+except Exception:
+    _lxml_etree = None  # type: ignore
+
+
+def _make_session() -> requests.Session:
+    """keep-alive 풀링 + 재시도 설정이 붙은 공유 세션 생성.
+
+    requests-cache가 설치돼 있으면 SQLite 기반 HTTP 캐시를 사용한다.
+    같은 URL 재요청은 네트워크 RTT 대신 로컬 조회로 끝난다.
+    (LAWGO_HTTP_CACHE=0 으로 비활성화 가능)
+    """
+    if CachedSession and os.getenv("LAWGO_HTTP_CACHE", "1") != "0":
+        cache_path = os.getenv("LAWGO_HTTP_CACHE_PATH", "data/lawgo_cache.sqlite")
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        # TTL은 초 단위 env로 조정 가능 (기본 7일)
+        ttl = float(os.getenv("LAWGO_HTTP_CACHE_TTL", "0") or 0) or timedelta(days=7).total_seconds()
+        session: requests.Session = CachedSession(
+            cache_path,
+            allowable_methods=("GET",),
+            expire_after=ttl,
+        )
+    else:
+        session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        ),
+    )
+    return session
+
+
+_SESSION = _make_session()
 
 
 def _timeout() -> tuple[float, float]:
@@ -16,25 +67,62 @@ def _timeout() -> tuple[float, float]:
 
 
 def _norm(value: str) -> str:
-    return (value or "").replace(" ", "").strip()
+    if not isinstance(value, str):  # lxml 주석 노드 등은 tag가 str이 아니다
+        return ""
+    # law.go.kr 응답 태그는 네임스페이스/공백이 없어 대부분 이 분기로 끝난다
+    if " " not in value:
+        return value
+    return value.replace(" ", "").strip()
+
 
+def _index(node: ET.Element) -> Dict[str, ET.Element]:
+    """자식 노드를 정규화된 태그명 → 노드 dict로 한 번만 인덱싱.
 
-def _find_text(node: ET.Element, *candidates: str) -> str:
+    노드당 여러 필드를 조회할 때 매번 자식 전체를 도는 대신 dict 조회로 끝낸다.
+    """
+    idx: Dict[str, ET.Element] = {}
+    for child in node:
+        tag = _norm(child.tag)
+        if tag and tag not in idx:
+            idx[tag] = child
+    return idx
+
+
+def _indexed_text(idx: Dict[str, ET.Element], *candidates: str) -> str:
     for cand in candidates:
         if not cand:
             continue
-        text = node.findtext(cand)
-        if text:
-            return text.strip()
+        child = idx.get(_norm(cand))
+        if child is not None and child.text:
+            return child.text.strip()
 
+    # 정확 일치 실패 시 부분 일치 폴백 (태그명에 잡음이 섞인 응답 대비)
     norm_candidates = [_norm(c) for c in candidates if c]
-    for child in node:
-        tag_norm = _norm(child.tag)
-        if any(c in tag_norm for c in norm_candidates):
+    for tag, child in idx.items():
+        if any(c in tag for c in norm_candidates):
             return (child.text or "").strip()
     return ""
 
 
+_XPATH_CACHE: Dict[tuple, Any] = {}
+
+
+def _iter_tagged(node: ET.Element, *substrings: str) -> List[ET.Element]:
+    """태그명에 substrings 중 하나가 포함된 직계 자식 목록.
+
+    lxml이 있으면 한 번 컴파일한 XPath(contains(local-name(), ...))로
+    C 레벨에서 걸러내고, 없으면 기존 파이썬 루프로 폴백한다.
+    """
+    if _lxml_etree is not None:
+        xpath = _XPATH_CACHE.get(substrings)
+        if xpath is None:
+            cond = " or ".join(f"contains(local-name(), '{s}')" for s in substrings)
+            xpath = _lxml_etree.XPath(f"./*[{cond}]")
+            _XPATH_CACHE[substrings] = xpath
+        return xpath(node)
+    return [child for child in node if any(s in _norm(child.tag) for s in substrings)]
+
+
 def _int_or_zero(value: Optional[str]) -> int:
     try:
         return int(value)
@@ -42,10 +130,19 @@ def _int_or_zero(value: Optional[str]) -> int:
         return 0
 
 
-def _fetch_xml(url: str) -> ET.Element:
-    res = requests.get(url, timeout=_timeout())
+def _parse_xml_bytes(content: bytes) -> ET.Element:
+    # bytes를 바로 파싱해 res.text의 불필요한 디코딩을 생략한다.
+    # lxml(libxml2)이 있으면 그쪽이 훨씬 빠르다. find/findtext API는 호환.
+    if _lxml_etree is not None:
+        return _lxml_etree.fromstring(content)
+    return ET.fromstring(content)
+
+
+def _fetch_xml(base: str, params: Dict[str, Any]) -> ET.Element:
+    # params=로 넘기면 requests가 키워드를 안전하게 URL 인코딩한다.
+    res = _SESSION.get(base, params=params, timeout=_timeout())
     res.raise_for_status()
-    return ET.fromstring(res.text)
+    return _parse_xml_bytes(res.content)
 
 
 def _pick_total_count(root: ET.Element) -> int:
@@ -69,133 +166,210 @@ def get_oc() -> str:
     return "turtle816"
 
 
-def fetch_daily_terms(keyword: str, page: int = 1, num_rows: int = 20) -> Dict[str, Any]:
-    oc = get_oc()
-    url = (
-        "https://www.law.go.kr/DRF/lawSearch.do"
-        f"?OC={oc}&target=dlytrm&type=XML&query={keyword}&display={num_rows}&page={page}"
-    )
-    root = _fetch_xml(url)
+_BASE_SEARCH = "https://www.law.go.kr/DRF/lawSearch.do"
+_BASE_SERVICE = "https://www.law.go.kr/DRF/lawService.do"
+
+
+def _daily_terms_params(keyword: str, page: int, num_rows: int) -> Dict[str, Any]:
+    return {
+        "OC": get_oc(), "target": "dlytrm", "type": "XML",
+        "query": keyword, "display": num_rows, "page": page,
+    }
+
+
+def _daily_to_legal_params(daily_term_id: str) -> Dict[str, Any]:
+    return {"OC": get_oc(), "target": "dlytrmRlt", "type": "XML", "MST": daily_term_id}
+
+
+def _legal_to_article_params(legal_term_id: str) -> Dict[str, Any]:
+    return {"OC": get_oc(), "target": "lstrmRltJo", "type": "XML", "MST": legal_term_id}
+
+
+def _legal_terms_params(keyword: str, page: int, num_rows: int) -> Dict[str, Any]:
+    return {
+        "OC": get_oc(), "target": "lstrmAI", "type": "XML",
+        "query": keyword, "display": num_rows, "page": page,
+    }
+
+
+def _parse_daily_terms(root: ET.Element) -> Dict[str, Any]:
     total_count = _pick_total_count(root)
 
     items: List[Dict[str, str]] = []
-    for child in root:
-        if "일상용어" in _norm(child.tag):
-            items.append(
-                {
-                    "id": child.attrib.get("id") or _find_text(child, "id"),
-                    "name": _find_text(child, "일상용어명", "일상용어"),
-                    "source": _find_text(child, "출처"),
-                    "stem_relation_link": _find_text(child, "어간관계링크", "어간관계링크"),
-                }
-            )
+    for child in _iter_tagged(root, "일상용어"):
+        idx = _index(child)
+        items.append(
+            {
+                "id": child.attrib.get("id") or _indexed_text(idx, "id"),
+                "name": _indexed_text(idx, "일상용어명", "일상용어"),
+                "source": _indexed_text(idx, "출처"),
+                "stem_relation_link": _indexed_text(idx, "어간관계링크", "어간관계링크"),
+            }
+        )
 
     return {"total_count": total_count, "items": items}
 
 
-def fetch_daily_to_legal(daily_term_id: str) -> Dict[str, Any]:
-    oc = get_oc()
-    url = (
-        "https://www.law.go.kr/DRF/lawService.do"
-        f"?OC={oc}&target=dlytrmRlt&type=XML&MST={daily_term_id}"
-    )
+def fetch_daily_terms(keyword: str, page: int = 1, num_rows: int = 20) -> Dict[str, Any]:
+    return _parse_daily_terms(_fetch_xml(_BASE_SEARCH, _daily_terms_params(keyword, page, num_rows)))
 
-    root = _fetch_xml(url)
-    daily_node = None
-    for child in root:
-        if "일상용어" in _norm(child.tag):
-            daily_node = child
-            break
+
+def _parse_daily_to_legal(root: ET.Element, daily_term_id: str) -> Dict[str, Any]:
+    daily_nodes = _iter_tagged(root, "일상용어")
+    daily_node = daily_nodes[0] if daily_nodes else None
 
     if daily_node is None:
         return {"daily_term_id": daily_term_id, "daily_term_name": "", "source": "", "legal_terms": []}
 
     legal_terms: List[Dict[str, str]] = []
-    for rel_node in daily_node:
-        tag_norm = _norm(rel_node.tag)
-        if not any(key in tag_norm for key in ("관련", "연계", "관계용어")):
-            continue
+    for rel_node in _iter_tagged(daily_node, "관련", "연계", "관계용어"):
+        idx = _index(rel_node)
         legal_terms.append(
             {
                 "id": rel_node.attrib.get("id")
-                or _find_text(rel_node, "관련용어id", "법령용어id", "법령용어코드"),
-                "name": _find_text(rel_node, "법령용어명", "법령용어"),
-                "relation_code": _find_text(rel_node, "용어관계코드"),
-                "relation": _find_text(rel_node, "용어관계"),
-                "note": _find_text(rel_node, "비고"),
+                or _indexed_text(idx, "관련용어id", "법령용어id", "법령용어코드"),
+                "name": _indexed_text(idx, "법령용어명", "법령용어"),
+                "relation_code": _indexed_text(idx, "용어관계코드"),
+                "relation": _indexed_text(idx, "용어관계"),
+                "note": _indexed_text(idx, "비고"),
             }
         )
 
+    daily_idx = _index(daily_node)
     return {
         "daily_term_id": daily_term_id,
-        "daily_term_name": _find_text(daily_node, "일상용어명", "일상용어"),
-        "source": _find_text(daily_node, "출처"),
+        "daily_term_name": _indexed_text(daily_idx, "일상용어명", "일상용어"),
+        "source": _indexed_text(daily_idx, "출처"),
         "legal_terms": legal_terms,
     }
 
 
-def fetch_legal_to_article(legal_term_id: str) -> Dict[str, Any]:
-    oc = get_oc()
-    url = (
-        "https://www.law.go.kr/DRF/lawService.do"
-        f"?OC={oc}&target=lstrmRltJo&type=XML&MST={legal_term_id}"
-    )
-    root = _fetch_xml(url)
-    legal_node = None
-    for child in root:
-        if "법령용어" in _norm(child.tag):
-            legal_node = child
-            break
+# MST가 같으면 결과도 같으므로 프로세스 내 메모이즈.
+# 캐시된 dict가 공유되므로 호출자는 결과를 수정하지 말 것 (pipeline은 복사해 씀).
+@lru_cache(maxsize=10000)
+def fetch_daily_to_legal(daily_term_id: str) -> Dict[str, Any]:
+    return _parse_daily_to_legal(_fetch_xml(_BASE_SERVICE, _daily_to_legal_params(daily_term_id)), daily_term_id)
+
+
+def _parse_legal_to_article(root: ET.Element, legal_term_id: str) -> Dict[str, Any]:
+    legal_nodes = _iter_tagged(root, "법령용어")
+    legal_node = legal_nodes[0] if legal_nodes else None
 
     if legal_node is None:
         return {"legal_term_id": legal_term_id, "legal_term_name": "", "articles": []}
 
     articles: List[Dict[str, str]] = []
-    for rel_node in legal_node:
-        if "관련법령" not in _norm(rel_node.tag):
-            continue
+    for rel_node in _iter_tagged(legal_node, "관련법령"):
+        idx = _index(rel_node)
         articles.append(
             {
                 "law_id": rel_node.attrib.get("id") or "",
-                "law_name": _find_text(rel_node, "법령명", "법령이름"),
-                "article_number": _find_text(rel_node, "조번호", "조문번호"),
-                "order_number": _find_text(rel_node, "조령지번호", "조직지번호"),
-                "content": _find_text(rel_node, "조문내용"),
-                "term_type_code": _find_text(rel_node, "용어구분코드"),
-                "term_type": _find_text(rel_node, "용어구분"),
-                "article_relation_link": _find_text(
-                    rel_node, "조문관계어링크", "조문관계용어링크"
+                "law_name": _indexed_text(idx, "법령명", "법령이름"),
+                "article_number": _indexed_text(idx, "조번호", "조문번호"),
+                "order_number": _indexed_text(idx, "조령지번호", "조직지번호"),
+                "content": _indexed_text(idx, "조문내용"),
+                "term_type_code": _indexed_text(idx, "용어구분코드"),
+                "term_type": _indexed_text(idx, "용어구분"),
+                "article_relation_link": _indexed_text(
+                    idx, "조문관계어링크", "조문관계용어링크"
                 ),
             }
         )
 
+    legal_idx = _index(legal_node)
     return {
         "legal_term_id": legal_term_id,
-        "legal_term_name": _find_text(legal_node, "법령용어명", "법령용어"),
+        "legal_term_name": _indexed_text(legal_idx, "법령용어명", "법령용어"),
         "articles": articles,
     }
 
 
-def fetch_legal_terms(keyword: str, page: int = 1, num_rows: int = 20) -> Dict[str, Any]:
-    oc = get_oc()
-    url = (
-        "https://www.law.go.kr/DRF/lawSearch.do"
-        f"?OC={oc}&target=lstrmAI&type=XML&query={keyword}&display={num_rows}&page={page}"
-    )
-    root = _fetch_xml(url)
+@lru_cache(maxsize=10000)
+def fetch_legal_to_article(legal_term_id: str) -> Dict[str, Any]:
+    return _parse_legal_to_article(_fetch_xml(_BASE_SERVICE, _legal_to_article_params(legal_term_id)), legal_term_id)
+
+
+def _parse_legal_terms(root: ET.Element) -> Dict[str, Any]:
     total_count = _pick_total_count(root)
 
     items: List[Dict[str, str]] = []
-    for child in root:
-        if "법령용어" in _norm(child.tag):
-            items.append(
-                {
-                    "id": child.attrib.get("id") or _find_text(child, "id"),
-                    "name": _find_text(child, "법령용어명", "법령용어"),
-                    "note": _find_text(child, "비고"),
-                    "between_terms_link": _find_text(child, "용어관계링크"),
-                    "between_articles_link": _find_text(child, "조문관계링크"),
-                }
-            )
-
-    return {"total_count": total_count, "items": items}
+    for child in _iter_tagged(root, "법령용어"):
+        idx = _index(child)
+        items.append(
+            {
+                "id": child.attrib.get("id") or _indexed_text(idx, "id"),
+                "name": _indexed_text(idx, "법령용어명", "법령용어"),
+                "note": _indexed_text(idx, "비고"),
+                "between_terms_link": _indexed_text(idx, "용어관계링크"),
+                "between_articles_link": _indexed_text(idx, "조문관계링크"),
+            }
+        )
+
+    return {"total_count": total_count, "items": items}
+
+
+def fetch_legal_terms(keyword: str, page: int = 1, num_rows: int = 20) -> Dict[str, Any]:
+    return _parse_legal_terms(_fetch_xml(_BASE_SEARCH, _legal_terms_params(keyword, page, num_rows)))
+
+
+# -------------------------------------------------
+# Async API: httpx가 설치돼 있으면 여러 GET을 한 이벤트 루프에서
+# 동시에 처리할 수 있다. 파싱 로직은 sync 경로와 공유.
+# -------------------------------------------------
+try:
+    import httpx  # type: ignore
+except Exception:
+    httpx = None  # type: ignore
+
+
+def has_async_client() -> bool:
+    return httpx is not None
+
+
+def make_async_client() -> "httpx.AsyncClient":
+    """law.go.kr 호출용 AsyncClient (커넥션 풀 제한 포함).
+
+    h2 패키지가 있으면 HTTP/2를 협상해 연결 하나로 다중 요청을 싣는다.
+    서버가 h2를 거부하면 httpx가 HTTP/1.1 keep-alive로 자동 폴백한다.
+    """
+    if httpx is None:
+        raise RuntimeError("async API를 쓰려면 httpx를 설치하세요 (pip install httpx).")
+    connect, read = _timeout()
+    kwargs: Dict[str, Any] = dict(
+        timeout=httpx.Timeout(connect=connect, read=read, write=read, pool=connect),
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    )
+    try:
+        return httpx.AsyncClient(http2=True, **kwargs)
+    except ImportError:  # h2 미설치
+        return httpx.AsyncClient(**kwargs)
+
+
+async def _afetch_xml(client: "httpx.AsyncClient", base: str, params: Dict[str, Any]) -> ET.Element:
+    res = await client.get(base, params=params)
+    res.raise_for_status()
+    return _parse_xml_bytes(res.content)
+
+
+async def afetch_daily_terms(
+    client: "httpx.AsyncClient", keyword: str, page: int = 1, num_rows: int = 20
+) -> Dict[str, Any]:
+    root = await _afetch_xml(client, _BASE_SEARCH, _daily_terms_params(keyword, page, num_rows))
+    return _parse_daily_terms(root)
+
+
+async def afetch_daily_to_legal(client: "httpx.AsyncClient", daily_term_id: str) -> Dict[str, Any]:
+    root = await _afetch_xml(client, _BASE_SERVICE, _daily_to_legal_params(daily_term_id))
+    return _parse_daily_to_legal(root, daily_term_id)
+
+
+async def afetch_legal_to_article(client: "httpx.AsyncClient", legal_term_id: str) -> Dict[str, Any]:
+    root = await _afetch_xml(client, _BASE_SERVICE, _legal_to_article_params(legal_term_id))
+    return _parse_legal_to_article(root, legal_term_id)
+
+
+async def afetch_legal_terms(
+    client: "httpx.AsyncClient", keyword: str, page: int = 1, num_rows: int = 20
+) -> Dict[str, Any]:
+    root = await _afetch_xml(client, _BASE_SEARCH, _legal_terms_params(keyword, page, num_rows))
+    return _parse_legal_terms(root)
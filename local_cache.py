@@ -9,8 +9,14 @@ from __future__ import annotations
 
 import json
 import os
+from collections import defaultdict
 from functools import lru_cache
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, Iterator, List
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
 
 
 DATA_DIR = os.getenv("LAWGO_DATA_DIR", "data")
@@ -18,20 +24,28 @@ LSTRM_PATH = os.path.join(DATA_DIR, "lstrm.jsonl")
 LSTRM_RLT_PATH = os.path.join(DATA_DIR, "lstrm_rlt.jsonl")
 
 
-def _read_jsonl(path: str) -> List[Dict[str, Any]]:
+# orjson이 있으면 C 파서 사용 (작은 dict에서 stdlib 대비 수 배 빠름).
+# 행마다 분기하지 않도록 백엔드를 임포트 시점에 한 번만 고른다.
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def iter_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    """JSONL 행을 스트리밍으로 순회. 바이너리로 읽어 텍스트 디코딩 단계를 생략."""
     if not os.path.exists(path):
-        return []
-    rows: List[Dict[str, Any]] = []
-    with open(path, "r", encoding="utf-8") as f:
+        return
+    with open(path, "rb") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
             try:
-                rows.append(json.loads(line))
+                yield _loads(line)
             except Exception:
                 continue
-    return rows
+
+
+def _read_jsonl(path: str) -> List[Dict[str, Any]]:
+    return list(iter_jsonl(path))
 
 
 @lru_cache(maxsize=1)
@@ -61,6 +75,37 @@ def _relations_by_legal() -> Dict[str, List[Dict[str, Any]]]:
     return grouped
 
 
+@lru_cache(maxsize=1)
+def _name_trigram_index() -> Dict[str, frozenset]:
+    """법령용어명 3-gram → 행 인덱스 역색인.
+
+    토큰 검색 시 전체 용어를 선형 스캔하는 대신, 토큰의 3-gram posting
+    교집합으로 후보를 좁힌 뒤 정확한 부분 문자열 검사만 수행한다.
+    """
+    idx: Dict[str, set] = defaultdict(set)
+    for i, lt in enumerate(load_legal_terms()):
+        name = str(lt.get("name") or lt.get("법령용어명") or "")
+        for j in range(len(name) - 2):
+            idx[name[j : j + 3]].add(i)
+    return {gram: frozenset(rows) for gram, rows in idx.items()}
+
+
+def _candidate_rows(token: str) -> List[int] | None:
+    """3-gram 교집합으로 후보 행 인덱스를 구한다. 토큰이 짧으면 None(폴백)."""
+    if len(token) < 3:
+        return None
+    tri_idx = _name_trigram_index()
+    rows: set | None = None
+    for j in range(len(token) - 2):
+        posting = tri_idx.get(token[j : j + 3])
+        if not posting:
+            return []
+        rows = set(posting) if rows is None else rows & posting
+        if not rows:
+            return []
+    return sorted(rows or ())
+
+
 def _matches(token: str, name: str) -> bool:
     token = token.strip()
     name = name.strip()
@@ -82,7 +127,13 @@ def local_daily_candidates(token: str, max_daily: int = 30, max_legal: int = 50)
     rel_by_legal = _relations_by_legal()
     daily_map: Dict[str, Dict[str, Any]] = {}
 
-    matched_legal = [lt for lt in legal_terms if _matches(token, str(lt.get("name") or lt.get("법령용어명") or ""))]
+    rows = _candidate_rows(token)
+    if rows is None:
+        # 짧은 토큰은 기존 선형 스캔으로 폴백
+        candidates: Iterable[Dict[str, Any]] = legal_terms
+    else:
+        candidates = (legal_terms[i] for i in rows)
+    matched_legal = [lt for lt in candidates if _matches(token, str(lt.get("name") or lt.get("법령용어명") or ""))]
     matched_legal = matched_legal[:max_legal]
 
     for lt in matched_legal:
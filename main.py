@@ -1,12 +1,38 @@
 ﻿from __future__ import annotations
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 
-from pipeline import run_pipeline
+# ORJSONResponse 임포트는 orjson이 없어도 성공하고 렌더 시점에야 터지므로
+# orjson 자체의 임포트 성공 여부로 기본 응답 클래스를 고른다.
+try:
+    import orjson  # noqa: F401
+
+    from fastapi.responses import ORJSONResponse as _DefaultResponse  # orjson 직렬화
+except Exception:  # orjson 미설치 시 stdlib json 폴백
+    from fastapi.responses import JSONResponse as _DefaultResponse  # type: ignore
+
+from keyword_extractor import warm_up
+from law_api import has_async_client
+from pipeline import run_pipeline, run_pipeline_async
+
 
-app = FastAPI(title="Legal Translator", version="0.2.0")
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # Okt(JVM) 예열: 첫 /translate 요청의 수 초짜리 콜드스타트 제거
+    warm_up()
+    yield
+
+
+app = FastAPI(
+    title="Legal Translator",
+    version="0.2.0",
+    lifespan=_lifespan,
+    default_response_class=_DefaultResponse,
+)
 
 # Dev CORS 허용 (필요 시 제한)
 app.add_middleware(
@@ -75,12 +101,21 @@ async def health_check():
 @app.post("/translate", response_model=TranslateResponse)
 async def translate(request: TranslateRequest):
     try:
-        result = run_pipeline(
-            request.text,
-            top_k=request.top_k,
-            daily_per_keyword=request.daily_per_keyword,
-            legal_per_daily=request.legal_per_daily,
-        )
+        if has_async_client():
+            # httpx가 있으면 이벤트 루프를 막지 않는 비동기 팬아웃 사용
+            result = await run_pipeline_async(
+                request.text,
+                top_k=request.top_k,
+                daily_per_keyword=request.daily_per_keyword,
+                legal_per_daily=request.legal_per_daily,
+            )
+        else:
+            result = run_pipeline(
+                request.text,
+                top_k=request.top_k,
+                daily_per_keyword=request.daily_per_keyword,
+                legal_per_daily=request.legal_per_daily,
+            )
     except Exception as exc:  # pragma: no cover - network/IO paths
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -1,37 +1,60 @@
 ﻿from __future__ import annotations
 
+import asyncio
 import os
+import re
 import time
+from functools import lru_cache
 from typing import Any, Dict, List, Sequence
 
 from keyword_extractor import extract_keywords, expand_related_terms
-from law_api import fetch_daily_terms, fetch_daily_to_legal, fetch_legal_to_article
+from law_api import (
+    afetch_daily_terms,
+    afetch_daily_to_legal,
+    afetch_legal_to_article,
+    fetch_daily_terms,
+    fetch_daily_to_legal,
+    fetch_legal_to_article,
+    has_async_client,
+    make_async_client,
+)
 from local_cache import local_daily_candidates
 
 
 MAX_DAILY_PAGES = int(os.getenv("LAWGO_MAX_PAGES", "1") or "1")
 DAILY_PER_PAGE = int(os.getenv("LAWGO_PER_PAGE", "20") or "20")
 SEARCH_BUDGET_SEC = float(os.getenv("LAWGO_SEARCH_BUDGET", "6") or "6")
+ASYNC_CONCURRENCY = int(os.getenv("LAWGO_ASYNC_CONCURRENCY", "16") or "16")
 
+# 문장 경계 후보를 한 번의 C 레벨 스캔으로 찾는다 (개별 str.split 5회 대체)
+_SENT_RE = re.compile(r"\. |。|…|[!?]")
+_NL_TABLE = str.maketrans("\n", " ")
 
-def _pick_summary(contents: Sequence[str], limit: int = 160) -> str:
+
+@lru_cache(maxsize=4096)
+def _pick_summary_cached(contents: tuple[str, ...], limit: int = 160) -> str:
     for text in contents:
         if not text:
             continue
-        cleaned = text.replace("\n", " ").strip()
+        cleaned = text.translate(_NL_TABLE).strip()
         if not cleaned:
             continue
-        # 문장 단위로 자르고, 기본 요약 길이 제한 적용
-        for split_char in (". ", "。", "…", "!", "?"):
-            if split_char in cleaned:
-                cleaned = cleaned.split(split_char)[0]
-                break
+        # 가장 앞선 문장 경계에서 자르고, 기본 요약 길이 제한 적용
+        match = _SENT_RE.search(cleaned)
+        if match:
+            cleaned = cleaned[: match.start()]
         if len(cleaned) > limit:
             return cleaned[: limit - 1] + "…"
         return cleaned
     return ""
 
 
+def _pick_summary(contents: Sequence[str], limit: int = 160) -> str:
+    # 같은 법령어가 여러 일상어에 걸쳐 나오면 동일 조문 목록을 반복 요약하게
+    # 되므로, 내용 튜플을 키로 결과를 캐시한다.
+    return _pick_summary_cached(tuple(contents), limit)
+
+
 def run_pipeline(
     text: str,
     top_k: int = 8,
@@ -47,6 +70,8 @@ def run_pipeline(
     """
 
     # 원문 내 단어만 사용: 확장/유사어는 비활성화 (검색 확장은 token 단위로 별도 처리)
+    # extract_keywords는 (text, top_k, ...) 단위로 lru_cache돼 있어 반복 입력은
+    # 형태소 분석 없이 즉시 반환된다.
     tokens = extract_keywords(text, top_k=top_k, expand_synonyms=False)
     warnings: List[str] = []
 
@@ -56,11 +81,14 @@ def run_pipeline(
         term: str,
         per_page: int = DAILY_PER_PAGE,
         max_pages: int = MAX_DAILY_PAGES,
+        known_ids: set[str] | None = None,
     ) -> list[dict[str, Any]]:
         """일상용어를 페이지 단위로 수집 (환경변수로 페이지 수/크기 조절)."""
-        items: list[dict[str, Any]] = []
+        # dict 삽입 순서가 곧 수집 순서: C 레벨에서 페이지 간 중복까지 제거된다
+        items: dict[str, dict[str, Any]] = {}
         page = 1
         total_count = None
+        fetched = 0
         start = time.monotonic()
         while page <= max_pages:
             if time.monotonic() - start > SEARCH_BUDGET_SEC:
@@ -73,20 +101,30 @@ def run_pipeline(
                 break
 
             batch = result.get("items", [])
-            items.extend(batch)
+            fetched += len(batch)
+            items.update((it["id"], it) for it in batch if it.get("id"))
             total_count = result.get("total_count") or total_count
 
-            if total_count and len(items) >= total_count:
+            # 확장 검색어가 원 토큰과 겹칠 때: 새 id 비율이 낮으면 다음
+            # 페이지도 거의 중복일 것이므로 페이지네이션을 끊는다
+            if known_ids is not None and batch:
+                novel = sum(1 for it in batch if it.get("id") and it["id"] not in known_ids)
+                if novel / len(batch) < 0.2:
+                    break
+
+            if total_count and fetched >= total_count:
                 break
             if len(batch) < per_page:  # 마지막 페이지
                 break
             page += 1
 
-        return items
+        return list(items.values())
 
     for tok in tokens:
         daily_candidates: List[Dict[str, Any]] = []
         seen_daily_ids = set()
+        # 같은 법령어가 한 토큰의 여러 일상어에 걸려 있으면 조문 조회를 재사용
+        article_results: Dict[str, Dict[str, Any]] = {}
 
         # 0) 로컬 캐시 기반 일상어 후보 우선 사용 (네트워크 호출 없이 빠르게)
         local_daily = local_daily_candidates(tok, max_daily=daily_per_keyword * 2)
@@ -99,7 +137,9 @@ def run_pipeline(
         # 원본 토큰 + 관련 확장어를 순차적으로 검색, 모자라면 이어붙임
         search_terms = [tok] + expand_related_terms(tok)
         for term in search_terms:
-            daily_items = _fetch_all_daily(term, per_page=max(20, daily_per_keyword))
+            daily_items = _fetch_all_daily(
+                term, per_page=max(20, daily_per_keyword), known_ids=seen_daily_ids
+            )
 
             for daily_item in daily_items:
                 daily_id = daily_item.get("id")
@@ -118,11 +158,14 @@ def run_pipeline(
                     legal_id = legal.get("id")
                     if not legal_id:
                         continue
-                    try:
-                        article_result = fetch_legal_to_article(legal_id)
-                    except Exception as exc:  # pragma: no cover - network/IO paths
-                        warnings.append(f"legal->article failed for '{legal_id}': {exc}")
-                        article_result = {"articles": []}
+                    article_result = article_results.get(legal_id)
+                    if article_result is None:
+                        try:
+                            article_result = fetch_legal_to_article(legal_id)
+                        except Exception as exc:  # pragma: no cover - network/IO paths
+                            warnings.append(f"legal->article failed for '{legal_id}': {exc}")
+                            article_result = {"articles": []}
+                        article_results[legal_id] = article_result
 
                     articles = article_result.get("articles", [])
                     summary = _pick_summary([a.get("content", "") for a in articles])
@@ -144,3 +187,202 @@ def run_pipeline(
         "keywords": tokens,  # backwards compatibility
         "warnings": warnings,
     }
+
+
+async def _afetch_all_daily(
+    client,
+    sem: asyncio.Semaphore,
+    term: str,
+    warnings: List[str],
+    per_page: int = DAILY_PER_PAGE,
+    max_pages: int = MAX_DAILY_PAGES,
+    known_ids: set[str] | None = None,
+) -> list[dict[str, Any]]:
+    """_fetch_all_daily의 비동기 버전. 페이지는 순차지만 용어끼리는 동시 수집된다."""
+    items: dict[str, dict[str, Any]] = {}
+    page = 1
+    total_count = None
+    fetched = 0
+    while page <= max_pages:
+        try:
+            async with sem:
+                result = await afetch_daily_terms(client, term, page=page, num_rows=per_page)
+        except Exception as exc:  # pragma: no cover - network/IO paths
+            warnings.append(f"daily search failed for '{term}': {exc}")
+            break
+
+        batch = result.get("items", [])
+        fetched += len(batch)
+        items.update((it["id"], it) for it in batch if it.get("id"))
+        total_count = result.get("total_count") or total_count
+
+        # 새 id 비율이 낮으면 다음 페이지는 거의 중복 → 중단
+        if known_ids is not None and batch:
+            novel = sum(1 for it in batch if it.get("id") and it["id"] not in known_ids)
+            if novel / len(batch) < 0.2:
+                break
+
+        if total_count and fetched >= total_count:
+            break
+        if len(batch) < per_page:  # 마지막 페이지
+            break
+        page += 1
+
+    return list(items.values())
+
+
+async def run_pipeline_async(
+    text: str,
+    top_k: int = 8,
+    daily_per_keyword: int = 3,
+    legal_per_daily: int = 5,
+) -> Dict[str, Any]:
+    """run_pipeline의 비동기 버전.
+
+    병목은 전부 law.go.kr RTT이므로 검색어/일상어/법령어 팬아웃을
+    asyncio.gather로 동시에 날린다. 동시 요청 수는 세마포어로 제한해
+    서버 측 rate limit을 넘지 않도록 한다. httpx 미설치 시에는
+    호출 측(main.py)이 기존 동기 run_pipeline으로 폴백한다.
+    """
+
+    tokens = extract_keywords(text, top_k=top_k, expand_synonyms=False)
+    warnings: List[str] = []
+    keyword_bundles: List[Dict[str, Any]] = []
+    sem = asyncio.Semaphore(ASYNC_CONCURRENCY)
+    start = time.monotonic()
+
+    async def _bounded(coros: list, what: str) -> list:
+        """전역 검색 예산(SEARCH_BUDGET_SEC) 안에서 실행하고 초과분은 취소.
+
+        예산을 토큰별로 따로 주면 느린 용어 하나가 전체를 잡아먹으므로
+        파이프라인 전체가 예산 하나를 나눠 쓴다.
+        """
+        if not coros:
+            return []
+        tasks = [asyncio.ensure_future(c) for c in coros]
+        remaining = SEARCH_BUDGET_SEC - (time.monotonic() - start)
+        if remaining <= 0:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            warnings.append(f"search budget exhausted (>{SEARCH_BUDGET_SEC}s); skipped {what}")
+            return []
+
+        done, pending = await asyncio.wait(tasks, timeout=remaining)
+        if pending:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            warnings.append(f"search budget exceeded (>{SEARCH_BUDGET_SEC}s); dropped {len(pending)} {what}")
+
+        results: list = []
+        for task in tasks:  # 제출 순서를 보존해 결과 순서를 결정적으로 유지
+            if task.done() and not task.cancelled() and task.exception() is None:
+                results.append(task.result())
+        return results
+
+    async def _fetch_article(client, legal_id: str) -> Dict[str, Any]:
+        try:
+            async with sem:
+                return await afetch_legal_to_article(client, legal_id)
+        except Exception as exc:  # pragma: no cover - network/IO paths
+            warnings.append(f"legal->article failed for '{legal_id}': {exc}")
+            return {"articles": []}
+
+    async def _fill_legal(client, article_results: Dict[str, Any], legal: Dict[str, Any]) -> Dict[str, Any] | None:
+        legal_id = legal.get("id")
+        if not legal_id:
+            return None
+        # 같은 법령어가 한 토큰의 여러 일상어에 걸려 있으면 조문 조회를 재사용
+        # (sync 경로의 article_results와 동일). Task를 캐시하므로 동시에
+        # 출발한 중복 요청도 하나로 합쳐진다.
+        task = article_results.get(legal_id)
+        if task is None:
+            task = asyncio.ensure_future(_fetch_article(client, legal_id))
+            article_results[legal_id] = task
+        article_result = await task
+
+        articles = article_result.get("articles", [])
+        return {
+            **legal,
+            "articles": articles,
+            "summary": _pick_summary([a.get("content", "") for a in articles]),
+            "legal_term_name": article_result.get("legal_term_name", legal.get("name", "")),
+        }
+
+    async def _map_daily(client, article_results: Dict[str, Any], tok: str, daily_item: Dict[str, Any]) -> Dict[str, Any]:
+        daily_id = daily_item.get("id")
+        try:
+            async with sem:
+                mapped = await afetch_daily_to_legal(client, daily_id)
+        except Exception as exc:  # pragma: no cover - network/IO paths
+            warnings.append(f"daily->legal failed for '{daily_id}': {exc}")
+            mapped = {"legal_terms": []}
+
+        filled = await asyncio.gather(
+            *(
+                _fill_legal(client, article_results, legal)
+                for legal in mapped.get("legal_terms", [])[:legal_per_daily]
+            )
+        )
+        return {**daily_item, "keyword": tok, "legal_terms": [lc for lc in filled if lc]}
+
+    async with make_async_client() as client:
+        for tok in tokens:
+            daily_candidates: List[Dict[str, Any]] = []
+            seen_daily_ids = set()
+            # legal_id → 조문 조회 Task (토큰 단위 재사용 캐시)
+            article_results: Dict[str, Any] = {}
+
+            # 0) 로컬 캐시 기반 일상어 후보 우선 사용 (네트워크 호출 없이 빠르게)
+            for item in local_daily_candidates(tok, max_daily=daily_per_keyword * 2):
+                did = item.get("id")
+                if did and did not in seen_daily_ids:
+                    seen_daily_ids.add(did)
+                    daily_candidates.append(item)
+
+            # 원본 토큰 + 관련 확장어 검색을 전부 동시에 발사
+            search_terms = [tok] + expand_related_terms(tok)
+            per_term = await _bounded(
+                [
+                    _afetch_all_daily(
+                        client,
+                        sem,
+                        term,
+                        warnings,
+                        per_page=max(20, daily_per_keyword),
+                        known_ids=seen_daily_ids,
+                    )
+                    for term in search_terms
+                ],
+                "daily searches",
+            )
+
+            fresh: List[Dict[str, Any]] = []
+            for daily_items in per_term:
+                for daily_item in daily_items:
+                    daily_id = daily_item.get("id")
+                    if not daily_id or daily_id in seen_daily_ids:
+                        continue
+                    seen_daily_ids.add(daily_id)
+                    fresh.append(daily_item)
+
+            daily_candidates.extend(
+                await _bounded(
+                    [_map_daily(client, article_results, tok, daily_item) for daily_item in fresh],
+                    "daily->legal mappings",
+                )
+            )
+            # 예산 초과로 매퍼가 취소되면 캐시된 조문 Task가 남을 수 있다
+            leftovers = [t for t in article_results.values() if not t.done()]
+            if leftovers:
+                for t in leftovers:
+                    t.cancel()
+                await asyncio.gather(*leftovers, return_exceptions=True)
+            keyword_bundles.append({"token": tok, "daily_terms": daily_candidates})
+
+    return {
+        "tokens": keyword_bundles,
+        "keywords": tokens,  # backwards compatibility
+        "warnings": warnings,
+    }
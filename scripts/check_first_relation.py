@@ -11,44 +11,75 @@ from __future__ import annotations
 import argparse
 import json
 import os
+from array import array
 from typing import Any, Dict, Iterable, List
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from envfile import load_env_file
 
-def _load_env_file(paths: list[str] | None = None) -> None:
-    """간단한 .env 로더: KEY=VAL 또는 KEY = VAL 형태를 지원."""
-    if paths is None:
-        paths = [".env"]
-    for path in paths:
-        if not os.path.exists(path):
-            continue
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#") or "=" not in line:
-                        continue
-                    key, val = line.split("=", 1)
-                    key = key.strip()
-                    val = val.strip().strip('"').strip("'")
-                    if key and key not in os.environ:
-                        os.environ[key] = val
-        except Exception:
-            continue
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
+# MST가 여러 개인 용어도 연결 하나로 조회하도록 keep-alive 세션 사용
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
 
 
 def _iter_dict_lists(obj: Any) -> Iterable[List[Dict[str, Any]]]:
-    """JSON 응답에서 dict list만 뽑아내는 얕은 순회."""
-    if isinstance(obj, dict):
-        for val in obj.values():
-            if isinstance(val, list) and val and isinstance(val[0], dict):
-                yield val  # type: ignore[misc]
-            elif isinstance(val, dict):
-                yield from _iter_dict_lists(val)
-    elif isinstance(obj, list):
-        for val in obj:
-            yield from _iter_dict_lists(val)
+    """JSON 응답에서 dict list만 뽑아내는 얕은 순회 (명시적 스택, 재귀 없음)."""
+    stack: list[Any] = [obj]
+    while stack:
+        cur = stack.pop()
+        if isinstance(cur, dict):
+            pending: list[Any] = []
+            for val in cur.values():
+                if isinstance(val, list) and val and isinstance(val[0], dict):
+                    yield val  # type: ignore[misc]
+                elif isinstance(val, dict):
+                    pending.append(val)
+            stack.extend(reversed(pending))
+        elif isinstance(cur, list):
+            stack.extend(reversed(cur))
+
+
+def _first_dict_list(obj: Any) -> List[Dict[str, Any]] | None:
+    """첫 dict list만 필요할 때 전체 순회를 생략."""
+    for lst in _iter_dict_lists(obj):
+        return lst
+    return None
+
+
+def _line_offsets(path: str) -> array:
+    """JSONL 행 시작 오프셋 인덱스 (.idx 파일에 캐시, mtime으로 무효화).
+
+    --index가 파일 깊숙이 있어도 앞의 행들을 디코딩하지 않고 바로 seek한다.
+    """
+    idx_path = path + ".idx"
+    try:
+        if os.path.getmtime(idx_path) >= os.path.getmtime(path):
+            offsets = array("Q")
+            with open(idx_path, "rb") as f:
+                offsets.frombytes(f.read())
+            return offsets
+    except OSError:
+        pass
+
+    offsets = array("Q")
+    pos = 0
+    with open(path, "rb") as f:
+        for line in f:
+            offsets.append(pos)
+            pos += len(line)
+    try:
+        with open(idx_path, "wb") as f:
+            offsets.tofile(f)
+    except OSError:
+        pass  # 인덱스를 못 쓰더라도 이번 실행은 계속한다
+    return offsets
 
 
 def parse_args() -> argparse.Namespace:
@@ -62,7 +93,7 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> None:
     args = parse_args()
-    _load_env_file()
+    load_env_file()
     oc = os.getenv("LAWGO_OC")
     if not oc:
         raise SystemExit("LAWGO_OC 환경변수를 설정하세요.")
@@ -70,16 +101,17 @@ def main() -> None:
     if not os.path.exists(args.path):
         raise SystemExit(f"파일을 찾을 수 없습니다: {args.path}")
 
+    offsets = _line_offsets(args.path)
     target_row = None
-    with open(args.path, "r", encoding="utf-8") as f:
-        for idx, line in enumerate(f):
-            if idx < args.index:
-                continue
-            line = line.strip()
-            if not line:
-                continue
-            target_row = json.loads(line)
-            break
+    if 0 <= args.index < len(offsets):
+        with open(args.path, "rb") as f:
+            f.seek(offsets[args.index])
+            for line in f:  # 빈 줄이면 다음 행으로 (기존 동작 유지)
+                line = line.strip()
+                if not line:
+                    continue
+                target_row = orjson.loads(line) if orjson is not None else json.loads(line)
+                break
     if target_row is None:
         raise SystemExit(f"{args.path}에서 index={args.index} 위치의 행을 찾을 수 없습니다.")
 
@@ -93,11 +125,11 @@ def main() -> None:
     per_id_counts: dict[str, int] = {}
     for mst in ids:
         url = f"https://www.law.go.kr/DRF/lawService.do?OC={oc}&target=lstrmRlt&type=JSON&MST={mst}"
-        res = requests.get(url, timeout=(args.timeout[0], args.timeout[1]))
+        res = SESSION.get(url, timeout=(args.timeout[0], args.timeout[1]))
         res.raise_for_status()
-        data = res.json()
-        lists = list(_iter_dict_lists(data))
-        count = len(lists[0]) if lists else 0
+        data = orjson.loads(res.content) if orjson is not None else res.json()
+        items = _first_dict_list(data)
+        count = len(items) if items else 0
         per_id_counts[mst] = count
         total_relations += count
 
@@ -0,0 +1,36 @@
+"""KEY=VAL 형태의 .env 파일을 os.environ에 싣는 공용 로더.
+
+fetch_lstrm_rlt.py / check_first_relation.py에 복사돼 있던 파서를 한 곳으로
+모았다. 따옴표 처리까지 정규식 한 번의 매치로 끝낸다.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from typing import Iterable
+
+# KEY = "VAL" | 'VAL' | VAL 을 한 패스로 처리
+_ENV_RE = re.compile(r"""^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(?:"([^"]*)"|'([^']*)'|(.*?))\s*$""")
+
+
+def load_env_file(paths: Iterable[str] = (".env",)) -> None:
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    stripped = line.strip()
+                    if not stripped or stripped.startswith("#"):
+                        continue
+                    match = _ENV_RE.match(line)
+                    if not match:
+                        continue
+                    key = match.group(1)
+                    val = next(g for g in match.groups()[1:] if g is not None)
+                    if key and key not in os.environ:
+                        os.environ[key] = val
+        except Exception:
+            # .env 파싱 실패 시 조용히 넘어간다.
+            continue
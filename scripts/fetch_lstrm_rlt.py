@@ -25,87 +25,257 @@ from __future__ import annotations
 
 import argparse
 import json
+import math
 import os
+import random
+import re
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import timedelta
 from typing import Any, Dict, Iterable, List
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from envfile import load_env_file
+
+try:
+    from requests_cache import CachedSession  # type: ignore
+except Exception:
+    CachedSession = None  # type: ignore
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
+try:
+    from pybloom_live import ScalableBloomFilter  # type: ignore
+except Exception:
+    ScalableBloomFilter = None  # type: ignore
+
+try:
+    import httpx  # type: ignore
+except Exception:
+    httpx = None  # type: ignore
+
+try:
+    from tqdm import tqdm  # type: ignore
+except Exception:
+    tqdm = None  # type: ignore
 
 GANA_CODES = ["ga", "na", "da", "ra", "ma", "ba", "sa", "aa", "ja", "cha", "ka", "ta", "pa", "ha"]
 
+# lstrmAI의 용어간관계링크에서 MST= 값만 뽑는다 (urlparse+parse_qs 대체)
+_MST_RE = re.compile(r"[?&]MST=([^&]+)")
+
+
+def _make_session(use_cache: bool = True) -> requests.Session:
+    """keep-alive 풀링 세션. 재시도는 404 스킵 등 상태별 분기가 필요해
+    _fetch_json의 파이썬 루프가 담당한다.
+
+    requests-cache가 있으면 SQLite 캐시를 붙여 --resume 재실행 시
+    같은 MST 재조회가 네트워크 없이 끝나도록 한다 (law_api와 동일 캐시).
+    """
+    if use_cache and CachedSession and os.getenv("LAWGO_HTTP_CACHE", "1") != "0":
+        cache_path = os.getenv("LAWGO_HTTP_CACHE_PATH", "data/lawgo_cache.sqlite")
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        # TTL은 초 단위 env로 조정 가능 (기본 7일, law_api와 동일)
+        ttl = float(os.getenv("LAWGO_HTTP_CACHE_TTL", "0") or 0) or timedelta(days=7).total_seconds()
+        session: requests.Session = CachedSession(
+            cache_path,
+            allowable_methods=("GET",),
+            expire_after=ttl,
+        )
+    else:
+        session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+    # 압축 응답 + keep-alive를 명시 (프록시/서버 기본값에 의존하지 않도록)
+    session.headers.update({"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"})
+    return session
+
+
+class _Http2Session:
+    """httpx 기반 HTTP/2 백엔드 (--http2).
+
+    서버가 h2 ALPN을 지원하면 연결 하나에 여러 요청을 다중화하므로
+    워커 수만큼 커넥션을 열 필요가 없어진다. _fetch_json이 쓰는
+    get(url, params=, timeout=(connect, read)) 인터페이스만 맞춘다.
+    h2 패키지가 없으면 httpx가 HTTP/1.1 keep-alive로 동작한다.
+    """
+
+    def __init__(self) -> None:
+        limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+        try:
+            self._client = httpx.Client(http2=True, limits=limits)
+        except ImportError:  # h2 미설치
+            self._client = httpx.Client(limits=limits)
+
+    def get(self, url: str, params: Dict[str, Any] | None = None, timeout: tuple[float, float] | None = None):
+        if timeout is not None:
+            connect, read = timeout
+            timeout = httpx.Timeout(connect=connect, read=read, write=read, pool=connect)
+        return self._client.get(url, params=params, timeout=timeout)
+
+
+# keep-alive 풀링: 수만 건의 MST 조회에서 TLS 핸드셰이크를 연결당 1회로 줄인다.
+SESSION: Any = _make_session()
+
 
 def _env(key: str, default: str = "") -> str:
     val = os.getenv(key)
     return val.strip() if val else default
 
 
-def _load_env_file(paths: list[str] | None = None) -> None:
-    """간단한 .env 로더: KEY=VAL 또는 KEY = VAL 형태를 지원."""
-    if paths is None:
-        paths = [".env"]
-    for path in paths:
-        if not os.path.exists(path):
-            continue
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#"):
-                        continue
-                    if "=" not in line:
-                        continue
-                    key, val = line.split("=", 1)
-                    key = key.strip()
-                    val = val.strip().strip('"').strip("'")
-                    if key and key not in os.environ:
-                        os.environ[key] = val
-        except Exception:
-            # .env 파싱 실패 시 조용히 넘어간다.
+def _iter_dict_lists(obj: Any) -> Iterable[List[Dict[str, Any]]]:
+    """JSON 응답에서 dict list만 뽑아내는 얕은 순회.
+
+    재귀 제너레이터 대신 명시적 스택을 쓴다: yield당 프레임 오버헤드가
+    없고 깊은 응답에서도 재귀 한도에 걸리지 않는다.
+    """
+    stack: list[Any] = [obj]
+    while stack:
+        cur = stack.pop()
+        if isinstance(cur, dict):
+            pending: list[Any] = []
+            for val in cur.values():
+                if isinstance(val, list) and val and isinstance(val[0], dict):
+                    yield val  # type: ignore[misc]
+                elif isinstance(val, dict):
+                    pending.append(val)
+            stack.extend(reversed(pending))  # 값 순서대로 내려가도록
+        elif isinstance(cur, list):
+            stack.extend(reversed(cur))
+
+
+def _first_dict_list(obj: Any) -> List[Dict[str, Any]] | None:
+    """호출부는 첫 리스트만 사용하므로 첫 발견 즉시 순회를 끝낸다."""
+    for lst in _iter_dict_lists(obj):
+        return lst
+    return None
+
+
+def _extract_items(data: Dict[str, Any]) -> List[Dict[str, Any]] | None:
+    """law.go.kr 응답의 고정 형태({루트: {"법령용어": [...]}})를 O(1) 깊이로 조회.
+
+    알려진 키에서 못 찾는 변형 응답만 제너릭 순회(_first_dict_list)로 폴백한다.
+    """
+    for root in data.values():
+        if isinstance(root, dict):
+            for key in ("법령용어", "일상용어", "연계용어", "item"):
+                val = root.get(key)
+                if isinstance(val, list) and val and isinstance(val[0], dict):
+                    return val
+    return _first_dict_list(data)
+
+
+def _total_count(data: Dict[str, Any]) -> int:
+    """응답에서 totalCnt를 찾아 정수로 반환 (없으면 0)."""
+    stack: list[Any] = [data]
+    while stack:
+        cur = stack.pop()
+        if not isinstance(cur, dict):
             continue
+        val = cur.get("totalCnt")
+        if val is not None:
+            try:
+                return int(str(val).strip())
+            except Exception:
+                return 0
+        stack.extend(v for v in cur.values() if isinstance(v, dict))
+    return 0
 
 
-def _iter_dict_lists(obj: Any) -> Iterable[List[Dict[str, Any]]]:
-    """JSON 응답에서 dict list만 뽑아내는 얕은 순회."""
-    if isinstance(obj, dict):
-        for val in obj.values():
-            if isinstance(val, list) and val and isinstance(val[0], dict):
-                yield val  # type: ignore[misc]
-            elif isinstance(val, dict):
-                yield from _iter_dict_lists(val)
-    elif isinstance(obj, list):
-        for val in obj:
-            yield from _iter_dict_lists(val)
-
-
-def _get(item: Dict[str, Any], *keys: str) -> str:
-    for key in keys:
-        if key in item and item[key]:
-            return str(item[key]).strip()
-    return ""
-
-
-def _fetch_json(url: str, timeout: tuple[float, float], retries: int, sleep_sec: float, label: str) -> Dict[str, Any]:
+class TokenBucket:
+    """스레드 공용 토큰 버킷 (rate req/s).
+
+    요청마다 고정 sleep을 거는 대신 전역 처리율만 강제한다: 서버가 빠르면
+    버킷이 차 있는 동안 즉시 진행하고, 워커 수와 무관하게 총량이 제한된다.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.ts = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.ts) * self.rate)
+                self.ts = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def _make_bucket(sleep_sec: float) -> TokenBucket | None:
+    """--sleep 값(요청 간격)을 전역 처리율로 환산. 0이면 제한 없음."""
+    return TokenBucket(1.0 / sleep_sec) if sleep_sec > 0 else None
+
+
+# orjson이 있으면 C 직렬화 (수십만 행 쓰기에서 stdlib 대비 수 배 빠름).
+# 백엔드 분기는 행마다가 아니라 임포트 시점에 한 번만 결정한다.
+if orjson is not None:
+
+    def _dumps_line(row: Dict[str, Any]) -> bytes:
+        return orjson.dumps(row) + b"\n"
+
+    _loads_line = orjson.loads
+else:
+
+    def _dumps_line(row: Dict[str, Any]) -> bytes:
+        return json.dumps(row, ensure_ascii=False).encode("utf-8") + b"\n"
+
+    _loads_line = json.loads
+
+
+# 재시도 백오프 상한/지터 계수
+_BACKOFF_MAX = 30.0
+_BACKOFF_JITTER = 0.5
+
+
+def _backoff(base: float, attempt: int) -> float:
+    """지수 백오프 + 지터. 동시 워커들의 재시도가 한꺼번에 몰리지 않게 한다."""
+    base = base if base > 0 else 0.1
+    return min(_BACKOFF_MAX, base * 2 ** (attempt - 1)) * (1 + random.random() * _BACKOFF_JITTER)
+
+
+_BASE_SEARCH = "https://www.law.go.kr/DRF/lawSearch.do"
+_BASE_SERVICE = "https://www.law.go.kr/DRF/lawService.do"
+
+
+def _fetch_json(
+    url: str, params: Dict[str, Any], timeout: tuple[float, float], retries: int, sleep_sec: float, label: str
+) -> Dict[str, Any]:
     """HTTP GET with retry/backoff, returns {} on repeated failure."""
     last_exc: Exception | None = None
     for attempt in range(1, retries + 1):
         try:
-            res = requests.get(url, timeout=timeout)
+            res = SESSION.get(url, params=params, timeout=timeout)
             res.raise_for_status()
+            if orjson is not None:
+                # 인코딩 추측 없이 바이트를 바로 파싱 (대형 페이지에서 수 배 빠름)
+                return orjson.loads(res.content)
             return res.json()
-        except requests.exceptions.HTTPError as exc:  # pragma: no cover - network
-            status = exc.response.status_code if exc.response is not None else None
+        except Exception as exc:  # pragma: no cover - network
+            # requests.HTTPError와 httpx.HTTPStatusError 모두 .response를
+            # 달고 오므로 status 분기를 백엔드 공통으로 처리한다.
+            status = getattr(getattr(exc, "response", None), "status_code", None)
             if status == 404:
                 print(f"[warn] {label} returned 404. skipping retries.")
                 return {}
+            if status is not None and 400 <= status < 500 and status != 429:
+                # 429를 제외한 4xx는 재시도해도 같은 답 → 즉시 포기
+                print(f"[warn] {label} failed with non-retryable status {status}. skipping retries.")
+                return {}
             last_exc = exc
-            wait = sleep_sec * attempt
-            print(
-                f"[warn] {label} attempt {attempt}/{retries} failed with status {status}: {exc}. retrying in {wait:.1f}s"
-            )
-            time.sleep(wait)
-        except Exception as exc:  # pragma: no cover - network
-            last_exc = exc
-            wait = sleep_sec * attempt
+            wait = _backoff(sleep_sec, attempt)
             print(f"[warn] {label} attempt {attempt}/{retries} failed: {exc}. retrying in {wait:.1f}s")
             time.sleep(wait)
     print(f"[error] {label} failed after {retries} retries: {last_exc}")
@@ -115,36 +285,36 @@ def _fetch_json(url: str, timeout: tuple[float, float], retries: int, sleep_sec:
 def fetch_lstrm_page(
     oc: str, gana: str, page: int, display: int, timeout: tuple[float, float], retries: int, sleep_sec: float
 ) -> Dict[str, Any]:
-    url = (
-        "https://www.law.go.kr/DRF/lawSearch.do"
-        f"?OC={oc}&target=lstrm&type=JSON&gana={gana}&display={display}&page={page}"
+    # params=로 넘기면 requests가 값 인코딩을 맡는다 (law_api와 동일 방식)
+    params = {"OC": oc, "target": "lstrm", "type": "JSON", "gana": gana, "display": display, "page": page}
+    return _fetch_json(
+        _BASE_SEARCH, params, timeout=timeout, retries=retries, sleep_sec=sleep_sec, label=f"lstrm {gana}/{page}"
     )
-    return _fetch_json(url, timeout=timeout, retries=retries, sleep_sec=sleep_sec, label=f"lstrm {gana}/{page}")
 
 
 def fetch_lstrm_page_query(
     oc: str, page: int, display: int, timeout: tuple[float, float], retries: int, sleep_sec: float
 ) -> Dict[str, Any]:
-    url = (
-        "https://www.law.go.kr/DRF/lawSearch.do"
-        f"?OC={oc}&target=lstrm&type=JSON&query=*&display={display}&page={page}"
+    params = {"OC": oc, "target": "lstrm", "type": "JSON", "query": "*", "display": display, "page": page}
+    return _fetch_json(
+        _BASE_SEARCH, params, timeout=timeout, retries=retries, sleep_sec=sleep_sec, label=f"lstrm query=*/{page}"
     )
-    return _fetch_json(url, timeout=timeout, retries=retries, sleep_sec=sleep_sec, label=f"lstrm query=*/{page}")
 
 
 def fetch_lstrm_ai_page(
     oc: str, page: int, display: int, timeout: tuple[float, float], retries: int, sleep_sec: float
 ) -> Dict[str, Any]:
-    url = (
-        "https://www.law.go.kr/DRF/lawSearch.do"
-        f"?OC={oc}&target=lstrmAI&type=JSON&query=*&display={display}&page={page}"
+    params = {"OC": oc, "target": "lstrmAI", "type": "JSON", "query": "*", "display": display, "page": page}
+    return _fetch_json(
+        _BASE_SEARCH, params, timeout=timeout, retries=retries, sleep_sec=sleep_sec, label=f"lstrmAI */{page}"
     )
-    return _fetch_json(url, timeout=timeout, retries=retries, sleep_sec=sleep_sec, label=f"lstrmAI */{page}")
 
 
 def fetch_lstrm_rlt(oc: str, mst: str, timeout: tuple[float, float], retries: int, sleep_sec: float) -> Dict[str, Any]:
-    url = f"https://www.law.go.kr/DRF/lawService.do?OC={oc}&target=lstrmRlt&type=JSON&MST={mst}"
-    return _fetch_json(url, timeout=timeout, retries=retries, sleep_sec=sleep_sec, label=f"lstrmRlt {mst}")
+    params = {"OC": oc, "target": "lstrmRlt", "type": "JSON", "MST": mst}
+    return _fetch_json(
+        _BASE_SERVICE, params, timeout=timeout, retries=retries, sleep_sec=sleep_sec, label=f"lstrmRlt {mst}"
+    )
 
 
 def collect_lstrm(
@@ -154,203 +324,318 @@ def collect_lstrm(
     sleep_sec: float,
     retries: int,
     strategy: str = "gana",
-) -> list[dict[str, str]]:
-    results: list[dict[str, str]] = []
-    seen_ids: set[str] = set()
+    out_path: str | None = None,
+) -> list[dict[str, str]] | int:
+    """법령용어 수집. out_path가 있으면 행을 발견 즉시 스트리밍 기록하고
+    기록 건수를 반환한다 (메모리에는 중복 검사용 ID 키만 남는다).
+    없으면 기존처럼 행 리스트를 반환한다.
+    """
+    # id → row 순서 보존 dict 하나로 중복 검사와 수집을 동시에 처리
+    # (set 멤버십 + list append의 이중 해시/연산을 없앤다).
+    # 스트리밍 모드에서는 값 대신 None 마커만 둬 상주 메모리를 키로 줄인다.
+    collected: dict[str, dict[str, str] | None] = {}
+    bucket = _make_bucket(sleep_sec)
+    writer = None
+    if out_path:
+        os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+        writer = open(out_path, "wb", buffering=1 << 20)
 
-    def _collect_gana() -> None:
-        for gana in GANA_CODES:
-            page = 1
-            while True:
-                data = fetch_lstrm_page(oc, gana, page, display, timeout, retries, sleep_sec)
+    def _emit(lid: str, row: dict[str, str]) -> None:
+        if writer is None:
+            collected[lid] = row
+        else:
+            collected[lid] = None
+            writer.write(_dumps_line(row))
+
+    def _add_lstrm_items(items: list[dict[str, Any]]) -> None:
+        # 수만 항목을 도는 최내곽 루프: _get 호출 프레임 대신 item.get 체인을
+        # 직접 쓴다 (항목당 함수 호출 ~5회 제거)
+        for item in items:
+            get = item.get
+            lid = get("법령용어ID") or get("법령용어id") or get("id")
+            if not lid:
+                continue
+            lid = str(lid).strip()
+            if not lid or lid in collected:
+                continue
+            _emit(lid, {
+                "id": lid,
+                "name": str(get("법령용어명") or get("법령용어") or "").strip(),
+                "note": str(get("비고") or get("법령용어상세검색") or "").strip(),
+                "dict_kind_code": str(get("사전구분코드") or "").strip(),
+                "law_kind_code": str(get("법령종류코드") or "").strip(),
+            })
+
+    def _fetch_gana_page(gana: str, page: int) -> Dict[str, Any]:
+        # 워커에서 버킷을 먼저 통과시켜 동시 제출에도 전역 처리율을 지킨다
+        # (collect_relations._task와 동일 패턴)
+        if bucket:
+            bucket.acquire()
+        return fetch_lstrm_page(oc, gana, page, display, timeout, retries, sleep_sec)
+
+    def _collect_gana(workers: int = 8, window: int = 8) -> None:
+        # gana끼리도 독립이므로 14개의 1페이지 탐침을 동시에 날리고,
+        # totalCnt로 확정된 나머지 페이지는 전 gana를 하나의 배치로 제출한다.
+        # totalCnt가 없는 gana만 window 단위 투기적 수집으로 폴백한다.
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            probes = {
+                gana: executor.submit(_fetch_gana_page, gana, 1)
+                for gana in GANA_CODES
+            }
+
+            followups: list[tuple[str, range]] = []  # totalCnt 확정 gana
+            speculative: list[str] = []  # totalCnt 미제공 gana
+            for gana in GANA_CODES:
+                data = probes[gana].result()
                 if not data:
-                    break
-                lists = list(_iter_dict_lists(data))
-                if not lists:
-                    break
-                items = lists[0]  # 가장 상위 리스트를 사용
+                    continue
+                items = _extract_items(data)  # 가장 상위 리스트를 사용
                 if not items:
-                    break
-
-                for item in items:
-                    lid = _get(item, "법령용어ID", "법령용어id", "id")
-                    name = _get(item, "법령용어명", "법령용어")
-                    if not lid or lid in seen_ids:
-                        continue
-                    seen_ids.add(lid)
-                    results.append(
-                        {
-                            "id": lid,
-                            "name": name,
-                            "note": _get(item, "비고", "법령용어상세검색"),
-                            "dict_kind_code": _get(item, "사전구분코드"),
-                            "law_kind_code": _get(item, "법령종류코드"),
-                        }
-                    )
-
+                    continue
+                _add_lstrm_items(items)
                 if len(items) < display:
+                    continue
+                total = _total_count(data)
+                if total:
+                    followups.append((gana, range(2, math.ceil(total / display) + 1)))
+                else:
+                    speculative.append(gana)
+
+            # 확정 페이지 일괄 제출 → (gana, page) 순서로 수집해 출력 순서 유지
+            page_futs = {
+                (gana, p): executor.submit(_fetch_gana_page, gana, p)
+                for gana, pages in followups
+                for p in pages
+            }
+            for gana, pages in followups:
+                for p in pages:
+                    data = page_futs[(gana, p)].result()
+                    items = _extract_items(data) if data else None
+                    if not items:
+                        break  # 이 gana의 이후 페이지는 버린다
+                    _add_lstrm_items(items)
+                    if len(items) < display:
+                        break
+
+            for gana in speculative:
+                page = 2
+                while True:
+                    batch = range(page, page + window)
+                    page_data = executor.map(
+                        lambda p: _fetch_gana_page(gana, p),
+                        batch,
+                    )
+                    stop = False
+                    for data in page_data:
+                        items = _extract_items(data) if data else None
+                        if not items:
+                            stop = True
+                            break
+                        _add_lstrm_items(items)
+                        if len(items) < display:
+                            stop = True
+                            break
+                    if stop:
+                        break
+                    page = batch.stop
+
+    def _add_lstrm_ai_items(items: list[dict[str, Any]]) -> None:
+        # lstrmAI 항목: 용어간관계링크에서 MST를 뽑아 ID로 쓰고, 링크 필드를 보존
+        for item in items:
+            get = item.get
+            link = str(get("용어간관계링크") or "").strip()
+            match = _MST_RE.search(link) if link else None
+            mst = match.group(1) if match else ""
+            lid = mst or str(get("법령용어ID") or get("법령용어id") or get("id") or "").strip()
+            if not lid or lid in collected:
+                continue
+            _emit(lid, {
+                "id": lid,
+                "name": str(get("법령용어명") or get("법령용어") or "").strip(),
+                "note": str(get("비고") or "").strip(),
+                "dict_kind_code": str(get("사전구분코드") or "").strip(),  # lstrmAI 응답에는 없지만 키 확보
+                "law_kind_code": str(get("법령종류코드") or "").strip(),
+                "relation_link": link,
+                "article_link": str(get("조문간관계링크") or "").strip(),
+                "raw_id": str(get("id") or "").strip(),
+            })
+
+    def _collect_paged(fetch_page, add_items) -> None:
+        # query=* 풀스캔 공용 페이지 루프 (fetcher/ingester만 다르다).
+        # 1페이지의 totalCnt로 페이지 수를 확정해 빈 꼬리 요청을 없앤다
+        # (_collect_gana의 followup 방식과 동일).
+        data = fetch_page(oc, 1, display, timeout, retries, sleep_sec)
+        if not data:
+            return
+        items = _extract_items(data)
+        if not items:
+            return
+        add_items(items)
+
+        total = _total_count(data)
+        if total > 0:
+            for page in range(2, math.ceil(total / display) + 1):
+                if bucket:
+                    bucket.acquire()
+                data = fetch_page(oc, page, display, timeout, retries, sleep_sec)
+                if not data:
                     break
-                page += 1
-                time.sleep(sleep_sec)
-
-    def _collect_query_all() -> None:
-        page = 1
-        while True:
-            data = fetch_lstrm_page_query(oc, page, display, timeout, retries, sleep_sec)
+                items = _extract_items(data)
+                if not items:
+                    break
+                add_items(items)
+            return
+
+        # totalCnt 미제공 응답: 기존 '짧은 페이지면 끝' 휴리스틱으로 폴백
+        page = 2
+        while len(items) >= display:
+            if bucket:
+                bucket.acquire()
+            data = fetch_page(oc, page, display, timeout, retries, sleep_sec)
             if not data:
                 break
-            lists = list(_iter_dict_lists(data))
-            if not lists:
-                break
-            items = lists[0]
+            items = _extract_items(data)
             if not items:
                 break
-            for item in items:
-                lid = _get(item, "법령용어ID", "법령용어id", "id")
-                name = _get(item, "법령용어명", "법령용어")
-                if not lid or lid in seen_ids:
-                    continue
-                seen_ids.add(lid)
-                results.append(
-                    {
-                        "id": lid,
-                        "name": name,
-                        "note": _get(item, "비고", "법령용어상세검색"),
-                        "dict_kind_code": _get(item, "사전구분코드"),
-                        "law_kind_code": _get(item, "법령종류코드"),
-                    }
-                )
-            if len(items) < display:
-                break
+            add_items(items)
             page += 1
-            time.sleep(sleep_sec)
 
     if strategy == "gana":
         _collect_gana()
     elif strategy == "query":
-        _collect_query_all()
+        _collect_paged(fetch_lstrm_page_query, _add_lstrm_items)
     elif strategy == "both":
         _collect_gana()
-        _collect_query_all()
+        _collect_paged(fetch_lstrm_page_query, _add_lstrm_items)
     elif strategy == "ai":
-        # lstrmAI로 query=* 풀스캔
-        page = 1
-        while True:
-            data = fetch_lstrm_ai_page(oc, page, display, timeout, retries, sleep_sec)
-            if not data:
-                break
-            # lstrmAISearch 루트에서 '법령용어' 리스트 추출
-            items: list[dict[str, Any]] = []
-            for val in data.values():
-                if isinstance(val, dict) and "법령용어" in val and isinstance(val["법령용어"], list):
-                    items = val["법령용어"]
-                    break
-            if not items:
-                break
-
-            for item in items:
-                link = _get(item, "용어간관계링크")
-                mst = ""
-                if link and "MST=" in link:
-                    try:
-                        import urllib.parse as up
-
-                        qs = up.urlparse(link).query
-                        mst = up.parse_qs(qs).get("MST", [""])[0]
-                    except Exception:
-                        mst = ""
-                lid = mst or _get(item, "법령용어ID", "법령용어id", "id")
-                name = _get(item, "법령용어명", "법령용어")
-                if not lid or lid in seen_ids:
-                    continue
-                seen_ids.add(lid)
-                results.append(
-                    {
-                        "id": lid,
-                        "name": name,
-                        "note": _get(item, "비고"),
-                        "dict_kind_code": _get(item, "사전구분코드"),  # lstrmAI 응답에는 없지만 키 확보
-                        "law_kind_code": _get(item, "법령종류코드"),
-                        "relation_link": link,
-                        "article_link": _get(item, "조문간관계링크"),
-                        "raw_id": _get(item, "id"),
-                    }
-                )
-            if len(items) < display:
-                break
-            page += 1
-            time.sleep(sleep_sec)
+        _collect_paged(fetch_lstrm_ai_page, _add_lstrm_ai_items)
     else:  # pragma: no cover - defensive
         raise ValueError(f"unknown strategy: {strategy}")
-    return results
+    if writer is not None:
+        writer.flush()
+        writer.close()
+        return len(collected)
+    return list(collected.values())
 
 
 def collect_relations(
     oc: str,
-    legal_terms: list[dict[str, str]],
+    term_ids: list[str],
+    term_names: list[str],
     timeout: tuple[float, float],
     sleep_sec: float,
     retries: int,
-    processed_ids: set[str] | None = None,
+    processed_ids: Any = None,
     out_path: str | None = None,
     flush_every: int = 200,
+    workers: int = 8,
 ) -> list[dict[str, str]]:
     """
-    법령용어별 일상용어 연계를 수집.
-    processed_ids가 있으면 해당 법령용어ID는 건너뜀.
+    법령용어별 일상용어 연계를 수집. term_ids/term_names는 같은 길이의
+    평행 리스트다 (행 dict 전체 대신 루프가 쓰는 두 컬럼만 받는다).
+    processed_ids가 있으면 해당 법령용어ID는 건너뜀 (in/add만 쓰므로
+    set 대신 블룸 필터도 받는다).
     out_path가 있으면 실시간 append; 없으면 리스트로 반환.
+    MST별 조회는 서로 독립이므로 워커 스레드로 동시 수행한다.
     """
     results: list[dict[str, str]] = []
-    processed_ids = processed_ids or set()
+    if processed_ids is None:
+        processed_ids = set()
     writer = None
-    written = 0
+    buf: list[bytes] = []
     if out_path:
         os.makedirs(os.path.dirname(out_path), exist_ok=True)
-        writer = open(out_path, "a", encoding="utf-8")
-
-    def _write(row: dict[str, str]) -> None:
-        nonlocal written
-        if writer:
-            writer.write(json.dumps(row, ensure_ascii=False) + "\n")
-            written += 1
-            if written % flush_every == 0:
-                writer.flush()
-        else:
-            results.append(row)
-
-    for term in legal_terms:
-        raw_id = term.get("id") or term.get("법령용어ID") or term.get("법령용어id") or ""
+        # 바이너리 + 1MiB 버퍼: 행마다 syscall을 내지 않는다
+        writer = open(out_path, "ab", buffering=1 << 20)
+
+    def _write_rows(rows: list[dict[str, str]]) -> None:
+        # 응답(페이지) 단위로 모아 기록: 행마다가 아니라 페이지당 한 번만
+        # 이 경로를 탄다. flush_every 행이 쌓이면 b"".join 한 번 + flush.
+        if writer is None:
+            results.extend(rows)
+            return
+        buf.extend(_dumps_line(row) for row in rows)
+        if len(buf) >= flush_every:
+            writer.write(b"".join(buf))
+            buf.clear()
+            writer.flush()
+
+    # (mst, name) 작업 목록을 먼저 평탄화. 같은 MST가 여러 용어에 걸쳐
+    # 등장할 수 있으므로 제출 단계에서 한 번만 넣는다.
+    pending: list[tuple[str, str]] = []
+    queued: set[str] = set()
+    for raw_id, name in zip(term_ids, term_names):
         if not raw_id:
             continue
-        parts = [p for p in raw_id.replace(" ", "").split(",") if p]
-        for mst in parts:
-            if mst in processed_ids:
-                continue
-            data = fetch_lstrm_rlt(oc, mst, timeout, retries, sleep_sec)
-            lists = list(_iter_dict_lists(data))
-            if not lists:
-                time.sleep(sleep_sec)
+        for mst in (p for p in raw_id.replace(" ", "").split(",") if p):
+            if mst in processed_ids or mst in queued:
                 continue
-            items = lists[0]
-            for item in items:
-                daily_id = _get(item, "연계용어id", "id", "일상용어id")
-                daily_name = _get(item, "일상용어명", "연계용어명")
-                if not daily_id and not daily_name:
+            queued.add(mst)
+            pending.append((mst, name))
+
+    bucket = _make_bucket(sleep_sec)
+    # pending이 미리 걸러져 있어 전체 크기가 정확하다 (스킵 건은 0%부터 제외)
+    progress = tqdm(total=len(pending), unit="mst", desc="lstrmRlt") if tqdm is not None else None
+
+    def _task(mst: str) -> Dict[str, Any]:
+        if bucket:
+            bucket.acquire()  # 전역 처리율 제한 (워커 수와 무관)
+        return fetch_lstrm_rlt(oc, mst, timeout, retries, sleep_sec)
+
+    # 쓰기는 완료 future를 도는 메인 스레드에서만 일어나므로 락이 필요 없다.
+    # 제출은 워커당 4개까지만 앞서 나가게 묶는다: 수만 건을 한 번에 큐에
+    # 넣으면 future/결과가 전부 메모리에 잡혀 있게 된다.
+    max_workers = max(1, workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        todo = iter(pending)
+        futures: dict = {}
+
+        def _submit_next() -> None:
+            for mst, name in todo:
+                futures[executor.submit(_task, mst)] = (mst, name)
+                return
+
+        for _ in range(max_workers * 4):
+            _submit_next()
+
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                mst, legal_name = futures.pop(future)
+                data = future.result()
+                processed_ids.add(mst)
+                if progress is not None:
+                    progress.update(1)
+                _submit_next()
+                items = _extract_items(data)
+                if not items:
                     continue
-                _write(
-                    {
-                        "legal_id": mst,
-                        "legal_name": term.get("name", ""),
-                        "daily_id": daily_id,
-                        "daily_name": daily_name,
-                        "relation_code": _get(item, "용어관계코드"),
-                        "relation": _get(item, "용어관계"),
-                    }
-                )
-            processed_ids.add(mst)
-            time.sleep(sleep_sec)
+                rows: list[dict[str, str]] = []
+                for item in items:
+                    # 가변 인자 _get 대신 바인딩한 get + or 체인 (collect_lstrm과 동일 패턴)
+                    get = item.get
+                    daily_id = str(get("연계용어id") or get("id") or get("일상용어id") or "").strip()
+                    daily_name = str(get("일상용어명") or get("연계용어명") or "").strip()
+                    if not daily_id and not daily_name:
+                        continue
+                    rows.append(
+                        {
+                            "legal_id": mst,
+                            "legal_name": legal_name,
+                            "daily_id": daily_id,
+                            "daily_name": daily_name,
+                            "relation_code": str(get("용어관계코드") or "").strip(),
+                            "relation": str(get("용어관계") or "").strip(),
+                        }
+                    )
+                if rows:
+                    _write_rows(rows)
 
+    if progress is not None:
+        progress.close()
     if writer:
+        if buf:
+            writer.write(b"".join(buf))
         writer.flush()
         writer.close()
     return results
@@ -358,22 +643,88 @@ def collect_relations(
 
 def save_jsonl(path: str, rows: Iterable[dict[str, Any]]) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
+    with open(path, "wb", buffering=1 << 20) as f:
         for row in rows:
-            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+            f.write(_dumps_line(row))
+
+
+# _write가 쓰는 legal_id 키 (+ 과거 수집분의 한글 키 호환)
+_LEGAL_ID_RE = re.compile('"(?:legal_id|법령용어ID|법령용어id)"\\s*:\\s*"([^"]*)"'.encode("utf-8"))
+
+
+def _scan_processed_ids(path: str) -> set[str]:
+    """--resume용: 기존 lstrm_rlt.jsonl에서 legal_id만 추출.
+
+    행 전체를 JSON 파싱하지 않고 1MiB 청크 정규식 스캔으로 끝낸다.
+    청크 경계에 걸린 매치는 꼬리 일부를 carry로 이어 붙여 잡는다.
+    """
+    ids: set[str] = set()
+    empty = True
+    carry = b""
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(1 << 20)
+            if not chunk:
+                break
+            empty = False
+            buf = carry + chunk
+            for match in _LEGAL_ID_RE.finditer(buf):
+                ids.add(match.group(1).decode("utf-8", "ignore"))
+            carry = buf[-256:]
+    if ids or empty:
+        return ids
+
+    # 정규식이 하나도 못 잡으면(키 이름이 바뀐 과거 수집분 등) 행 단위
+    # 파싱으로 폴백한다. 느리지만 여전히 스트리밍이라 메모리는 O(고유 ID).
+    with open(path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = _loads_line(line)
+            except Exception:
+                continue
+            lid = row.get("legal_id") or row.get("법령용어ID") or row.get("법령용어id")
+            if lid:
+                ids.add(str(lid))
+    return ids
+
+
+def _load_term_columns(path: str) -> tuple[list[str], list[str]]:
+    """lstrm.jsonl에서 relations가 쓰는 두 컬럼(id, name)만 평행 리스트로 적재.
+
+    행 dict를 전부 들고 있으면 쓰지 않는 필드 3개가 메모리를 차지하므로
+    스트리밍으로 읽어 컬럼(SoA) 형태로 줄인다.
+    """
+    ids: list[str] = []
+    names: list[str] = []
+    with open(path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = _loads_line(line)
+            except Exception:
+                continue
+            get = row.get
+            ids.append(str(get("id") or get("법령용어ID") or get("법령용어id") or ""))
+            names.append(str(get("name") or get("법령용어명") or ""))
+    return ids, names
 
 
 def load_jsonl(path: str) -> list[dict[str, Any]]:
     if not os.path.exists(path):
         return []
     rows: list[dict[str, Any]] = []
-    with open(path, "r", encoding="utf-8") as f:
+    with open(path, "rb") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
             try:
-                rows.append(json.loads(line))
+                rows.append(_loads_line(line))
             except Exception:
                 continue
     return rows
@@ -391,6 +742,12 @@ def _add_common_fetch_args(parser: argparse.ArgumentParser) -> None:
         help="requests timeout (connect, read). 기본값은 env LAWGO_CONNECT_TIMEOUT / LAWGO_READ_TIMEOUT 또는 (3, 6)",
     )
     parser.add_argument("--retries", type=int, default=3, help="요청 실패 시 재시도 횟수 (기본 3)")
+    parser.add_argument("--no-cache", action="store_true", help="HTTP 디스크 캐시 비활성화 (항상 실서버 조회)")
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help="httpx 기반 HTTP/2 백엔드 사용 (httpx 필요, 디스크 캐시는 미적용)",
+    )
 
 
 def parse_args() -> argparse.Namespace:
@@ -426,17 +783,38 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="기존 lstrm_rlt.jsonl을 읽어 이미 처리한 법령ID는 건너뜀 (append 모드)",
     )
+    relation_parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="lstrmRlt 동시 조회 워커 수 (기본 8)",
+    )
     relation_parser.add_argument(
         "--lstrm-path",
         default=None,
         help="법령용어 목록 경로 (기본: <out-dir>/lstrm.jsonl)",
     )
+    relation_parser.add_argument(
+        "--bloom",
+        action="store_true",
+        help="--resume ID 집합을 블룸 필터로 유지 (pybloom_live 필요, 메모리 절약. "
+        "위양성 시 해당 ID 재조회만 생략됨)",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
+    global SESSION
+
     args = parse_args()
-    _load_env_file()
+    load_env_file()
+    if args.http2:
+        if httpx is None:
+            print("[warn] httpx가 없어 --http2를 무시합니다 (requests 사용).")
+        else:
+            SESSION = _Http2Session()
+    if args.no_cache and not isinstance(SESSION, _Http2Session):
+        SESSION = _make_session(use_cache=False)
     oc = _env("LAWGO_OC")
     if not oc:
         raise SystemExit("LAWGO_OC 환경변수를 설정하세요.")
@@ -453,16 +831,17 @@ def main() -> None:
     if args.command == "lstrm":
         lstrm_path = os.path.join(args.out_dir, "lstrm.jsonl")
         print(f"[lstrm] Fetching strategy={args.strategy} (display={args.display})...")
-        legal_terms = collect_lstrm(
+        # 스트리밍 기록: 전체 행 리스트를 메모리에 들고 있다가 다시 쓰지 않는다
+        count = collect_lstrm(
             oc,
             display=args.display,
             timeout=timeout,
             sleep_sec=args.sleep,
             retries=args.retries,
             strategy=args.strategy,
+            out_path=lstrm_path,
         )
-        save_jsonl(lstrm_path, legal_terms)
-        print(f"[lstrm] saved {len(legal_terms)} terms -> {lstrm_path}")
+        print(f"[lstrm] saved {count} terms -> {lstrm_path}")
         return
 
     lstrm_path = args.lstrm_path or os.path.join(args.out_dir, "lstrm.jsonl")
@@ -470,36 +849,47 @@ def main() -> None:
     if not os.path.exists(lstrm_path):
         raise SystemExit(f"법령용어 목록이 필요합니다: {lstrm_path}")
 
-    legal_terms = load_jsonl(lstrm_path)
-    print(f"[relations] Loaded {len(legal_terms)} legal terms from {lstrm_path}")
+    # 행 dict 전체 대신 id/name 두 컬럼만 적재 (SoA)
+    term_ids, term_names = _load_term_columns(lstrm_path)
+    print(f"[relations] Loaded {len(term_ids)} legal terms from {lstrm_path}")
 
     if args.max_terms:
-        legal_terms = legal_terms[: args.max_terms]
-        print(f"[relations] processing first {len(legal_terms)} terms due to --max-terms")
+        term_ids = term_ids[: args.max_terms]
+        term_names = term_names[: args.max_terms]
+        print(f"[relations] processing first {len(term_ids)} terms due to --max-terms")
 
-    if not legal_terms:
+    if not term_ids:
         print("[relations] No legal terms to process. Exiting.")
         return
 
-    processed_ids: set[str] = set()
+    processed_ids: Any = set()
     if args.resume and os.path.exists(rlt_path):
-        existing = load_jsonl(rlt_path)
-        for row in existing:
-            lid = row.get("legal_id") or row.get("법령용어ID") or row.get("법령용어id")
-            if lid:
-                processed_ids.add(str(lid))
+        # 행 전체를 파싱하지 않는 바이너리 스캔 (대형 파일에서 기동 수십 배 단축)
+        processed_ids = _scan_processed_ids(rlt_path)
         print(f"[resume] skipping {len(processed_ids)} already processed legal_ids from {rlt_path}")
+    if args.bloom:
+        if ScalableBloomFilter is None:
+            print("[warn] pybloom_live가 없어 --bloom을 무시합니다 (set 사용).")
+        else:
+            # 정확한 set 대신 확률적 멤버십: 키당 ~100B → ~1.4B.
+            # 위양성은 해당 MST의 무해한 재조회 생략으로 끝난다.
+            bloom = ScalableBloomFilter(initial_capacity=100_000, error_rate=0.001)
+            for mst in processed_ids:
+                bloom.add(mst)
+            processed_ids = bloom
 
     print(f"[relations] Fetching lstrmRlt for each term...")
     relations = collect_relations(
         oc,
-        legal_terms,
+        term_ids,
+        term_names,
         timeout=timeout,
         sleep_sec=args.sleep,
         retries=args.retries,
         processed_ids=processed_ids,
         out_path=rlt_path if args.resume else None,
         flush_every=args.flush_every,
+        workers=args.workers,
     )
     if not args.resume:
         save_jsonl(rlt_path, relations)